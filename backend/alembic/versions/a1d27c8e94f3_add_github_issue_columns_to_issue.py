@@ -0,0 +1,42 @@
+"""Add github issue columns to issue
+
+Revision ID: a1d27c8e94f3
+Revises: f3a86d95c214
+Create Date: 2026-08-31 13:36:05.483920
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1d27c8e94f3'
+down_revision: Union[str, None] = 'f3a86d95c214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Webhook handlers used to encode the GitHub number into the issue name
+    # and find it back with a LIKE scan; structured columns plus a partial
+    # unique index let them upsert in one statement instead.
+    op.add_column('issue', sa.Column('github_issue_number', sa.Integer(), nullable=True))
+    op.add_column('issue', sa.Column('is_github_pr', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_issue_project_github_number',
+            'issue',
+            ['project_id', 'github_issue_number', 'is_github_pr'],
+            unique=True,
+            postgresql_where=sa.text('github_issue_number IS NOT NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_issue_project_github_number', table_name='issue', postgresql_concurrently=True)
+    op.drop_column('issue', 'is_github_pr')
+    op.drop_column('issue', 'github_issue_number')
@@ -0,0 +1,55 @@
+"""Add composite (issue_id, created_at) indexes to comment and attachment
+
+Revision ID: a3f1c92b8d04
+Revises: 894fb8135097
+Create Date: 2026-08-31 10:14:52.118203
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c92b8d04'
+down_revision: Union[str, None] = '894fb8135097'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # List endpoints filter by issue_id and order by created_at; a composite
+    # index lets Postgres return rows already sorted instead of filtering on
+    # the single-column index and sorting afterwards.
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction, so the
+    # whole migration runs in an autocommit block and never blocks writers.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_comment_issue_id_created_at',
+            'comment',
+            ['issue_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_attachment_issue_id_created_at',
+            'attachment',
+            ['issue_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+        # The composite indexes cover every issue_id-only lookup, so the
+        # single-column indexes are now redundant
+        op.drop_index('idx_comment_issue_id', table_name='comment', postgresql_concurrently=True)
+        op.drop_index('idx_attachment_issue_id', table_name='attachment', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('idx_attachment_issue_id', 'attachment', ['issue_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_comment_issue_id', 'comment', ['issue_id'], unique=False, postgresql_concurrently=True)
+
+        op.drop_index('idx_attachment_issue_id_created_at', table_name='attachment', postgresql_concurrently=True)
+        op.drop_index('idx_comment_issue_id_created_at', table_name='comment', postgresql_concurrently=True)
@@ -0,0 +1,39 @@
+"""Add github_push_commits table
+
+Revision ID: b82e5f60d1c7
+Revises: a1d27c8e94f3
+Create Date: 2026-08-31 14:29:51.040188
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b82e5f60d1c7'
+down_revision: Union[str, None] = 'a1d27c8e94f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Activity log for GitHub pushes; (project_id, commit_sha) as the PK
+    # lets a whole push land as one multi-row INSERT ... ON CONFLICT DO
+    # NOTHING, so redeliveries are idempotent with no SELECT first.
+    op.create_table(
+        'github_push_commits',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('commit_sha', sa.String(length=40), nullable=False),
+        sa.Column('message', sa.String(), nullable=True),
+        sa.Column('author_name', sa.String(), nullable=True),
+        sa.Column('url', sa.String(), nullable=True),
+        sa.Column('pushed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['project.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'commit_sha')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('github_push_commits')
@@ -0,0 +1,50 @@
+"""Add GIN jsonb_path_ops indexes on data columns
+
+Revision ID: c58d2e417ab9
+Revises: a3f1c92b8d04
+Create Date: 2026-08-31 12:03:26.541877
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58d2e417ab9'
+down_revision: Union[str, None] = 'a3f1c92b8d04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_TABLES = (
+    ('organization', 'idx_org_data_gin'),
+    ('project', 'idx_project_data_gin'),
+    ('sprint', 'idx_sprint_data_gin'),
+)
+
+
+def upgrade() -> None:
+    # jsonb_path_ops GIN indexes only serve @> containment, but they are
+    # roughly a third the size of the default jsonb_ops and faster to probe,
+    # and containment is the only way the data columns get queried.
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction, so the
+    # whole migration runs in an autocommit block and never blocks writers.
+    with op.get_context().autocommit_block():
+        for table, index_name in _TABLES:
+            op.create_index(
+                index_name,
+                table,
+                ['data'],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={'data': 'jsonb_path_ops'},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, index_name in reversed(_TABLES):
+            op.drop_index(index_name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,58 @@
+"""Move delete cascades to the database
+
+Revision ID: d71f0ba33c55
+Revises: c58d2e417ab9
+Create Date: 2026-08-31 12:41:09.877215
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd71f0ba33c55'
+down_revision: Union[str, None] = 'c58d2e417ab9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (child table, FK column, parent table); constraint names are the
+# Postgres defaults ({table}_{column}_fkey) since the original
+# migrations created them unnamed
+_CASCADE_FKS = (
+    ('attachment', 'issue_id', 'issue'),
+    ('comment', 'issue_id', 'issue'),
+    ('system_logs', 'issue_id', 'issue'),
+    ('issue', 'parent_issue_id', 'issue'),
+    ('issue', 'sprint_id', 'sprint'),
+    ('sprint', 'project_id', 'project'),
+    ('project_member', 'project_id', 'project'),
+    ('project_member', 'organization_id', 'organization'),
+    ('project', 'organization_id', 'organization'),
+    ('organization_member', 'organization_id', 'organization'),
+)
+
+
+def _recreate(ondelete):
+    for table, column, referent in _CASCADE_FKS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(
+            name, table, referent,
+            [column], ['id'],
+            ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    # ORM-level cascade="all, delete-orphan" loads every child row just to
+    # issue one DELETE per row; with ON DELETE CASCADE in the schema (and
+    # passive_deletes=True on the relationships) deleting a parent is a
+    # single statement and the database fans out the rest.
+    _recreate('CASCADE')
+
+
+def downgrade() -> None:
+    _recreate(None)
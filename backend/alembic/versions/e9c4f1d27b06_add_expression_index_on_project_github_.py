@@ -0,0 +1,37 @@
+"""Add expression index on project github_repo
+
+Revision ID: e9c4f1d27b06
+Revises: d71f0ba33c55
+Create Date: 2026-08-31 13:07:44.302918
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9c4f1d27b06'
+down_revision: Union[str, None] = 'd71f0ba33c55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # find_project_by_repo runs on every single webhook event and filters by
+    # equality on data->>'github_repo'; a btree over the extracted text turns
+    # that sequential scan into an index probe.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_project_github_repo',
+            'project',
+            [sa.text("(data->>'github_repo')")],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_project_github_repo', table_name='project', postgresql_concurrently=True)
@@ -0,0 +1,39 @@
+"""Add github_username to user
+
+Revision ID: f3a86d95c214
+Revises: e9c4f1d27b06
+Create Date: 2026-08-31 13:22:18.664530
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a86d95c214'
+down_revision: Union[str, None] = 'e9c4f1d27b06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Replaces the leading-wildcard ILIKE over user.email the webhook path
+    # used to resolve event authors: a nullable column with a unique index
+    # makes that an exact, index-driven lookup.
+    op.add_column('user', sa.Column('github_username', sa.String(length=39), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'user_github_username_key',
+            'user',
+            ['github_username'],
+            unique=True,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('user_github_username_key', table_name='user', postgresql_concurrently=True)
+    op.drop_column('user', 'github_username')
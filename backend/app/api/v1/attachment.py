@@ -1,35 +1,57 @@
 """
 Attachment API endpoints
 """
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, UploadFile, File, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.db.connection import get_db
+from app.db.connection import get_db, AsyncSessionLocal
 from app.core.dependencies import get_current_user, allow_min_role
 from app.models.model import User
 from app.core.enums import Role
 from app.common.errors import NotFoundError, ClientErrors, DatabaseErrors
 from app.db.crud.attachment_crud import (
-    get_attachments_by_issue_id,
+    get_attachments_for_list,
     get_attachment_by_id,
     create_attachment,
-    delete_attachment
+    delete_attachment,
+    count_attachments_by_public_id,
+    get_attachment_public_id,
+    attachments_for_list_stmt
 )
 from app.services.cloudinary_service import CloudinaryService
 from app.schemas.attachment import (
     AttachmentListResponse,
     AttachmentUploadResponse,
     AttachmentDeleteResponse,
-    AttachmentResponse
+    AttachmentResponse,
+    attachment_list_adapter
 )
-from app.utils.file_validator import validate_file, format_file_size, sanitize_filename
+from app.utils.file_validator import validate_file, sniff_file_content, format_file_size, sanitize_filename
 from app.db.crud.issue_crud import get_issue_by_id
-import uuid
+import asyncio
+import hashlib
+import orjson
 
 attachment_router = APIRouter()
 cloudinary_service = CloudinaryService()
 
+# Serialized single-attachment DTOs; deletes in this process evict
+# eagerly, the short TTL bounds staleness from other workers
+_attachment_dto_cache = TTLCache(maxsize=2048, ttl=30)
+
+
+def _file_digest(file_obj) -> str:
+    """BLAKE2b hex digest of a spooled file object, read in 64KB chunks"""
+    hasher = hashlib.blake2b(digest_size=16)
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(65536), b""):
+        hasher.update(chunk)
+    file_obj.seek(0)
+    return hasher.hexdigest()
+
 
 @attachment_router.get("/issue/{issue_id}", response_model=AttachmentListResponse)
 async def get_issue_attachments(
@@ -45,30 +67,42 @@ async def get_issue_attachments(
     if not issue:
         raise NotFoundError(message="Issue not found")
     
-    attachments = await get_attachments_by_issue_id(issue_id, session)
-    
-    attachment_data = []
-    for attachment in attachments:
-        attachment_data.append(AttachmentResponse(
-            id=attachment.id,
-            issue_id=attachment.issue_id,
-            file_name=attachment.file_name,
-            file_size=attachment.file_size,
-            file_type=attachment.file_type,
-            file_url=attachment.file_url,
-            uploaded_by=attachment.uploaded_by,
-            uploader_name=attachment.uploader.name if attachment.uploader else None,
-            created_at=attachment.created_at,
-            updated_at=attachment.updated_at
-        ))
-    
+    rows = await get_attachments_for_list(issue_id, session)
+
+    # rows are plain column mappings keyed like the schema; the prebuilt
+    # adapter validates the whole list in one pydantic-core call
+    attachment_data = attachment_list_adapter.validate_python(rows)
+
     return AttachmentListResponse(
         data=attachment_data,
         count=len(attachment_data)
     )
 
 
-@attachment_router.post("/issue/{issue_id}/upload", response_model=AttachmentUploadResponse)
+@attachment_router.get("/issue/{issue_id}/stream")
+async def stream_issue_attachments(
+    issue_id: int,
+    current_user: User = Depends(allow_min_role(Role.EMPLOYEE)),
+):
+    """
+    Stream an issue's attachments as NDJSON
+
+    Rows come off a server-side cursor and are serialized one at a time,
+    so peak memory stays flat and the first byte goes out before the
+    last row is fetched. Intended for issues with very large attachment
+    lists; the regular list endpoint stays the default.
+    """
+    async def _ndjson():
+        # the generator outlives the handler, so it owns its session
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(attachments_for_list_stmt(issue_id))
+            async for row in result.mappings():
+                yield orjson.dumps(dict(row), default=str) + b"\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
+@attachment_router.post("/issue/{issue_id}/upload", response_model=AttachmentUploadResponse, status_code=status.HTTP_201_CREATED)
 async def upload_attachment(
     issue_id: int,
     file: UploadFile = File(...),
@@ -87,25 +121,36 @@ async def upload_attachment(
     is_valid, error_message = validate_file(file)
     if not is_valid:
         raise ClientErrors(message=error_message or "Invalid file")
+
+    # Content sniff on the first 512 bytes (skipped if python-magic is absent)
+    is_valid, error_message = await sniff_file_content(file)
+    if not is_valid:
+        raise ClientErrors(message=error_message or "Invalid file")
     
+    # Validate file size from the multipart metadata before touching the content
+    file_size = file.size
+    if file_size is None:
+        # no Content-Length (chunked client); the body is already spooled to
+        # a temp file, so measure it without reading it into memory
+        file.file.seek(0, 2)
+        file_size = file.file.tell()
+        file.file.seek(0)
+    if file_size > 10 * 1024 * 1024:  # 10MB
+        raise ClientErrors(message="File size exceeds maximum allowed size of 10MB")
+
     try:
-        # Read file content
-        file_content = await file.read()
-        file_size = len(file_content)
-        
-        # Validate file size
-        if file_size > 10 * 1024 * 1024:  # 10MB
-            raise ClientErrors(message="File size exceeds maximum allowed size of 10MB")
-        
         # Sanitize filename for safe storage
         sanitized_filename = sanitize_filename(file.filename or "unnamed_file")
-        
-        # Generate unique public_id for Cloudinary
-        public_id = f"zyro/attachments/issue_{issue_id}/{uuid.uuid4().hex}_{sanitized_filename}"
-        
-        # Upload to Cloudinary
-        upload_result = await cloudinary_service.upload_from_bytes(
-            file_bytes=file_content,
+
+        # Content-addressed public_id: identical bytes (e.g. the same
+        # screenshot pasted by several users) map to one Cloudinary asset
+        digest = await asyncio.to_thread(_file_digest, file.file)
+        public_id = f"zyro/attachments/{digest}"
+
+        # Stream the spooled temp file to Cloudinary in chunks instead of
+        # buffering the whole payload in memory
+        upload_result = await cloudinary_service.upload_stream(
+            file_obj=file.file,
             public_id=public_id
         )
         
@@ -113,6 +158,8 @@ async def upload_attachment(
         if isinstance(upload_result, dict):
             file_url = upload_result.get('secure_url') or upload_result.get('url')
             cloudinary_public_id = upload_result.get('public_id')
+            # Cloudinary reports the exact byte count it received
+            file_size = upload_result.get('bytes') or file_size
         else:
             file_url = str(upload_result)
             cloudinary_public_id = public_id
@@ -132,8 +179,10 @@ async def upload_attachment(
             uploaded_by=current_user.id
         )
         
+        # the uploader is the authenticated user, so fill the name from
+        # the request context instead of loading the relationship
         return AttachmentUploadResponse(
-            data=AttachmentResponse(
+            data=AttachmentResponse.model_construct(
                 id=attachment.id,
                 issue_id=attachment.issue_id,
                 file_name=attachment.file_name,
@@ -141,9 +190,9 @@ async def upload_attachment(
                 file_type=attachment.file_type,
                 file_url=attachment.file_url,
                 uploaded_by=attachment.uploaded_by,
-                uploader_name=attachment.uploader.name if attachment.uploader else None,
+                uploader_name=current_user.name,
                 created_at=attachment.created_at,
-                updated_at=attachment.updated_at
+                updated_at=attachment.updated_at,
             )
         )
         
@@ -160,20 +209,38 @@ async def delete_attachment_api(
     """
     Delete an attachment
     """
-    attachment = await get_attachment_by_id(attachment_id, session)
-    if not attachment:
+    # only the Cloudinary public_id is needed before the delete; skip the
+    # full row with its uploader/issue eager loads
+    public_id = await get_attachment_public_id(attachment_id, session)
+    if not public_id:
         raise NotFoundError(message="Attachment not found")
-    
+
+    # Uploads are deduped by content hash, so only drop the Cloudinary
+    # asset once no other attachment row references it
+    cloud_task = None
     try:
-        # Delete from Cloudinary
-        await cloudinary_service.delete_file(attachment.cloudinary_public_id)
+        references = await count_attachments_by_public_id(public_id, session)
+        if references <= 1:
+            # The DB delete does not depend on Cloudinary's response, so
+            # run the WAN round trip concurrently with the DB work
+            cloud_task = asyncio.create_task(
+                cloudinary_service.delete_file(public_id)
+            )
     except Exception as e:
-        # Log error but continue with database deletion
+        # Continue with database deletion regardless
         pass
-    
+
     # Delete from database
     await delete_attachment(session, attachment_id, current_user.id)
-    
+    _attachment_dto_cache.pop(attachment_id, None)
+
+    if cloud_task:
+        try:
+            await cloud_task
+        except Exception as e:
+            # Cloudinary failures never block the delete response
+            pass
+
     return AttachmentDeleteResponse()
 
 
@@ -186,19 +253,14 @@ async def get_attachment_api(
     """
     Get attachment details by ID
     """
+    cached = _attachment_dto_cache.get(attachment_id)
+    if cached is not None:
+        return cached
+
     attachment = await get_attachment_by_id(attachment_id, session)
     if not attachment:
         raise NotFoundError(message="Attachment not found")
-    
-    return AttachmentResponse(
-        id=attachment.id,
-        issue_id=attachment.issue_id,
-        file_name=attachment.file_name,
-        file_size=attachment.file_size,
-        file_type=attachment.file_type,
-        file_url=attachment.file_url,
-        uploaded_by=attachment.uploaded_by,
-        uploader_name=attachment.uploader.name if attachment.uploader else None,
-        created_at=attachment.created_at,
-        updated_at=attachment.updated_at
-    )
+
+    dto = AttachmentResponse.model_validate(attachment)
+    _attachment_dto_cache[attachment_id] = dto
+    return dto
@@ -1,5 +1,6 @@
+import asyncio
 import bcrypt
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 from app.db.connection import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.auth import SignUpRequest,LoginRequest,GoogleSignInRequest
@@ -7,21 +8,64 @@ from app.db.crud.user import (
     get_user_by_email,
     create_user_password,
     get_user_by_id,
-    get_user_by_google_user_id,
+    get_user_by_google_or_email,
     create_user_google
 )
 from app.common.errors import CredentialError,InvalidDataError,ClientErrors
+from app.models.model import User
+from app.cache.user_cache import (
+    user_cache_data,
+    get_cached_user,
+    set_cached_user
+)
 
 from app.core.security import (
     create_access_token,
     create_refresh_token,
+    hash_password,
     verify_password,
     decode_token,
     verify_google_token
 )
 auth_router = APIRouter()
 
-@auth_router.post("/signup")
+
+async def _token_response(user_data:dict,message:str) -> dict:
+    """
+    Build the token pair + user_data response from plain user fields
+    (either a User row or a cached copy of one)
+    """
+    payload = {
+        "user_id":user_data["id"],
+        "name":user_data["name"],
+        "email":user_data["email"],
+        "role":user_data["role"],
+        "type_of_signup":user_data["type_of_signup"]
+    }
+
+    access_token, refresh_token = await asyncio.gather(
+        create_access_token(payload),
+        create_refresh_token(payload)
+    )
+
+    return {
+        "status":"success",
+        "message":message,
+        "data":{
+            "access_token":access_token,
+            "refresh_token":refresh_token,
+            "user_data":user_data
+        }
+    }
+
+
+async def _auth_success(user:User,message:str) -> dict:
+    """
+    Build the token pair + user_data response shared by every auth endpoint
+    """
+    return await _token_response(user_cache_data(user),message=message)
+
+@auth_router.post("/signup", status_code=status.HTTP_201_CREATED)
 async def signup(
     request: SignUpRequest,
     session: AsyncSession = Depends(get_db)
@@ -30,13 +74,8 @@ async def signup(
     SignUp a user with email,password and name
     """
 
-    existing_user = await get_user_by_email(email=request.email, session=session)
-    
-    
-    if existing_user:
-        raise InvalidDataError(message="User already exists")
-    
-    # create user with email and password
+    # atomic insert: ON CONFLICT(email) DO NOTHING replaces the separate
+    # existence check, so no duplicate-signup race and one less round trip
     user = await create_user_password(
         name=request.name,
         email=request.email,
@@ -44,33 +83,11 @@ async def signup(
         session=session
     )
 
-    # generate jwt token
-    payload = {
-        "user_id":user.id,
-        "email":user.email,
-        "role":user.role.value,
-        "type_of_signup":user.type_of_signup.value
-    }
-    access_token = await create_access_token(payload)
-    refresh_token = await create_refresh_token(payload)
-
-    user_data = {
-        "id":user.id,
-        "name":user.name,
-        "email":user.email,
-        "role":user.role.value
-    }
+    if not user:
+        raise InvalidDataError(message="User already exists")
 
-    return {
-        "status":"success",
-        "message":"Signup successfully",
-        "data":{
-            "access_token":access_token,
-            "refresh_token":refresh_token,
-            "user_data":user_data
-        }
-        
-    }
+    # generate jwt token pair and respond
+    return await _auth_success(user,message="Signup successfully")
 
 @auth_router.post("/login")
 async def login(
@@ -93,33 +110,12 @@ async def login(
     if not await verify_password(password=password, hashed_password=user.password):
         raise CredentialError(message="Invalid email or password")
 
-    payload = {
-        "user_id": user.id,
-        "email": user.email,
-        "role":user.role.value,
-        "type_of_signup":user.type_of_signup.value
-    }
+    # transparently upgrade legacy bcrypt hashes to argon2id
+    if user.password.startswith("$2"):
+        user.password = await hash_password(password)
+        await session.commit()
 
-    access_token = await create_access_token(payload)
-    refresh_token = await create_refresh_token(payload)
-
-    user_data = {
-        "id":user.id,
-        "name":user.name,
-        "email":user.email,
-        "role":user.role.value,
-        "type_of_signup":user.type_of_signup.value
-    }
-
-    return {
-        "status":"success",
-        "message":"Login successfully",
-        "data":{
-            "access_token":access_token,
-            "refresh_token":refresh_token,
-            "user_data":user_data
-        }
-    }
+    return await _auth_success(user,message="Login successfully")
 
 @auth_router.post("/refresh")
 async def refresh_token(
@@ -135,37 +131,30 @@ async def refresh_token(
     
     payload = decode_token(refresh_token)
     user_id = payload.get("user_id")
+
+    # Tokens carry every claim the response needs; when all are present the
+    # refresh is pure CPU (verify + re-sign), no Redis or Postgres round trip
+    if all(payload.get(claim) is not None for claim in ("user_id","name","email","role","type_of_signup")):
+        user_data = {
+            "id":payload["user_id"],
+            "name":payload["name"],
+            "email":payload["email"],
+            "role":payload["role"],
+            "type_of_signup":payload["type_of_signup"]
+        }
+        return await _token_response(user_data,message="Token refreshed successfully")
+
+    # cache-first: a refresh normally costs one Redis GET instead of a SELECT
+    cached_user = await get_cached_user(user_id)
+    if cached_user:
+        return await _token_response(cached_user,message="Token refreshed successfully")
+
     user = await get_user_by_id(user_id=user_id,session=session)
     if not user:
         raise CredentialError(message="User not found")
-    
-    new_payload = {
-        "user_id":user.id,
-        "email":user.email,
-        "role":user.role.value,
-        "type_of_signup":user.type_of_signup.value
-    }
-
-    new_access_token = await create_access_token(new_payload)
-    new_refresh_token = await create_refresh_token(new_payload)
-
-    user_data = {
-        "id":user.id,
-        "name":user.name,
-        "email":user.email,
-        "role":user.role.value,
-        "type_of_signup":user.type_of_signup.value
-    }
 
-    return {
-        "status":"success",
-        "message":"Token refreshed successfully",
-        "data":{
-            "access_token":new_access_token,
-            "refresh_token":new_refresh_token,
-            "user_data":user_data
-        }
-    }
+    await set_cached_user(user)
+    return await _auth_success(user,message="Token refreshed successfully")
     
 @auth_router.post("/google-signin")
 async def sign_in_with_google(
@@ -189,12 +178,17 @@ async def sign_in_with_google(
     if not google_user_id or not email:
         raise CredentialError(message="Invalid google token")
     
-    user = await get_user_by_google_user_id(google_user_id=google_user_id,session=session)
-    
+    # One query covers both the google-id and the email-collision lookup
+    matches = await get_user_by_google_or_email(
+        google_user_id=google_user_id,
+        email=email,
+        session=session
+    )
+    user = next((u for u in matches if u.google_user_id == google_user_id),None)
+
     if not user:
-        existing_email_user = await get_user_by_email(email=email,session=session)
-        
-        if existing_email_user:
+        if matches:
+            # matched on email only -> account already registered another way
             raise ClientErrors(message="User already exists with this email")
         else:
             user =  await create_user_google(
@@ -203,37 +197,12 @@ async def sign_in_with_google(
                 email=email,
                 session=session
             )
+            if not user:
+                # email got registered concurrently between lookup and insert
+                raise ClientErrors(message="User already exists with this email")
     
     # If user exists, just log them in (no need to raise error)
-    
-    
-    payload = {
-        "user_id":user.id,
-        "email":user.email,
-        "role":user.role.value,
-        "type_of_signup":user.type_of_signup.value
-    }
-    
-    access_token = await create_access_token(payload)
-    refresh_token = await create_refresh_token(payload)
-    
-    user_data = {
-        "id":user.id,
-        "name":user.name,
-        "email":user.email,
-        "role":user.role.value,
-        "type_of_signup":user.type_of_signup.value
-    }
-    
-    return {
-        "status":"success",
-        "message":"Google signin successfully",
-        "data":{
-            "access_token":access_token,
-            "refresh_token":refresh_token,
-            "user_data":user_data
-        }
-    }
+    return await _auth_success(user,message="Google signin successfully")
     
 
     
@@ -1,6 +1,7 @@
 """
 Comment API endpoints
 """
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,7 +11,7 @@ from app.models.model import User
 from app.core.enums import Role
 from app.common.errors import NotFoundError, ClientErrors
 from app.db.crud.comment_crud import (
-    get_comments_by_issue_id,
+    get_comments_for_list,
     get_comment_by_id,
     create_comment,
     update_comment,
@@ -23,11 +24,16 @@ from app.schemas.comment import (
     CommentCreateResponse,
     CommentUpdateResponse,
     CommentDeleteResponse,
-    CommentResponse
+    CommentResponse,
+    comment_list_adapter
 )
 
 comment_router = APIRouter()
 
+# Serialized single-comment DTOs; mutations in this process evict
+# eagerly, the short TTL bounds staleness from other workers
+_comment_dto_cache = TTLCache(maxsize=2048, ttl=30)
+
 
 @comment_router.get("/issue/{issue_id}", response_model=CommentListResponse)
 async def get_issue_comments(
@@ -38,29 +44,19 @@ async def get_issue_comments(
     """
     Get all comments for an issue
     """
-    comments = await get_comments_by_issue_id(issue_id, session)
-    
-    comment_data = []
-    for comment in comments:
-        comment_data.append(CommentResponse(
-            id=comment.id,
-            issue_id=comment.issue_id,
-            user_id=comment.user_id,
-            user_name=comment.user.name if comment.user else None,
-            user_email=comment.user.email if comment.user else None,
-            content=comment.content,
-            edited=comment.edited,
-            created_at=comment.created_at,
-            updated_at=comment.updated_at
-        ))
-    
+    rows = await get_comments_for_list(issue_id, session)
+
+    # rows are plain column mappings keyed like the schema; the prebuilt
+    # adapter validates the whole list in one pydantic-core call
+    comment_data = comment_list_adapter.validate_python(rows)
+
     return CommentListResponse(
         data=comment_data,
         count=len(comment_data)
     )
 
 
-@comment_router.post("/", response_model=CommentCreateResponse)
+@comment_router.post("/", response_model=CommentCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_comment_api(
     request: CommentCreateRequest,
     current_user: User = Depends(allow_min_role(Role.EMPLOYEE)),
@@ -75,18 +71,20 @@ async def create_comment_api(
         user_id=current_user.id,
         content=request.content
     )
-    
+
+    # the author is the authenticated user, so fill the user fields from
+    # the request context instead of loading the relationship
     return CommentCreateResponse(
-        data=CommentResponse(
+        data=CommentResponse.model_construct(
             id=comment.id,
             issue_id=comment.issue_id,
             user_id=comment.user_id,
-            user_name=comment.user.name if comment.user else None,
-            user_email=comment.user.email if comment.user else None,
+            user_name=current_user.name,
+            user_email=current_user.email,
             content=comment.content,
             edited=comment.edited,
             created_at=comment.created_at,
-            updated_at=comment.updated_at
+            updated_at=comment.updated_at,
         )
     )
 
@@ -107,19 +105,10 @@ async def update_comment_api(
         user_id=current_user.id,
         content=request.content
     )
-    
+    _comment_dto_cache.pop(comment_id, None)
+
     return CommentUpdateResponse(
-        data=CommentResponse(
-            id=comment.id,
-            issue_id=comment.issue_id,
-            user_id=comment.user_id,
-            user_name=comment.user.name if comment.user else None,
-            user_email=comment.user.email if comment.user else None,
-            content=comment.content,
-            edited=comment.edited,
-            created_at=comment.created_at,
-            updated_at=comment.updated_at
-        )
+        data=CommentResponse.model_validate(comment)
     )
 
 
@@ -137,7 +126,8 @@ async def delete_comment_api(
         comment_id=comment_id,
         user_id=current_user.id
     )
-    
+    _comment_dto_cache.pop(comment_id, None)
+
     return CommentDeleteResponse()
 
 
@@ -150,18 +140,14 @@ async def get_comment_api(
     """
     Get comment details by ID
     """
+    cached = _comment_dto_cache.get(comment_id)
+    if cached is not None:
+        return cached
+
     comment = await get_comment_by_id(comment_id, session)
     if not comment:
         raise NotFoundError(message="Comment not found")
-    
-    return CommentResponse(
-        id=comment.id,
-        issue_id=comment.issue_id,
-        user_id=comment.user_id,
-        user_name=comment.user.name if comment.user else None,
-        user_email=comment.user.email if comment.user else None,
-        content=comment.content,
-        edited=comment.edited,
-        created_at=comment.created_at,
-        updated_at=comment.updated_at
-    )
+
+    dto = CommentResponse.model_validate(comment)
+    _comment_dto_cache[comment_id] = dto
+    return dto
@@ -1,14 +1,18 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.db.connection import get_db
+from app.db.connection import get_db, AsyncSessionLocal
 from app.core.dependencies import get_current_user, allow_min_role
-from app.models.model import User
+from app.models.model import User, Issue
 from app.common.errors import NotFoundError, DatabaseErrors, PermissionDeniedError
 from app.core.enums import IssueStatus, Role
 from app.schemas.issue import CreateIssueRequest, UpdateIssueRequest
 from app.db.crud.logs_crud import get_logs_by_issue_id
+from app.db.crud.attachment_crud import get_attachments_for_list
+from app.db.crud.comment_crud import get_comments_for_list
 from app.common.email_template import send_issue_assigned_mail, send_issue_status_update_mail
 from app.common.logging import Logger
 from app.db.crud.issue_crud import (
@@ -20,7 +24,6 @@ from app.db.crud.issue_crud import (
     get_user_issues,
     get_all_sub_issues
 )
-from app.db.crud.user import get_user_by_id
 from app.services.email_service import send_email
 from app.tasks.email_task import send_email_task
 from app.services.redis_publisher import redis_publisher
@@ -28,6 +31,54 @@ from app.utils.slack_notifier import send_slack_notification_for_issue
 
 issue_router = APIRouter()
 
+
+def _enum_value(value) -> str:
+    return value.value if hasattr(value, 'value') else str(value)
+
+
+def _issue_payload(issue: Issue) -> dict:
+    """
+    JSON-ready dict for an issue: enum and datetime conversions happen
+    here exactly once, shared by responses and Redis publishes
+    """
+    return {
+        "id": issue.id,
+        "name": issue.name,
+        "description": issue.description,
+        "status": _enum_value(issue.status),
+        "priority": _enum_value(issue.priority),
+        "type": _enum_value(issue.type),
+        "assigned_to": issue.assigned_to,
+        "assigned_by": issue.assigned_by,
+        "project_id": issue.project_id,
+        "sprint_id": issue.sprint_id,
+        "story_point": issue.story_point,
+        "parent_issue_id": issue.parent_issue_id,
+        "time_estimate": float(issue.time_estimate) if issue.time_estimate else None,
+        "created_at": issue.created_at.isoformat() if issue.created_at else None,
+        "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
+        "assignee": {
+            "id": issue.assignee.id,
+            "name": issue.assignee.name
+        } if issue.assignee else None,
+        "reporter": {
+            "id": issue.reporter.id,
+            "name": issue.reporter.name
+        } if issue.reporter else None,
+    }
+
+
+def _issue_notification_data(issue: Issue) -> dict:
+    """The slimmed-down issue fields Slack notifications use"""
+    return {
+        "id": issue.id,
+        "name": issue.name,
+        "description": issue.description,
+        "status": _enum_value(issue.status),
+        "priority": _enum_value(issue.priority),
+        "type": _enum_value(issue.type),
+    }
+
 @issue_router.get("/")  
 async def get_all_issues_api(
     current_user: User = Depends(allow_min_role(Role.EMPLOYEE)),
@@ -76,6 +127,42 @@ async def get_issue_by_id_api(
         "data": issue
     }
 
+@issue_router.get("/detail/{issue_id}")
+async def get_issue_detail_api(
+    issue_id: int,
+    current_user: User = Depends(allow_min_role(Role.EMPLOYEE)),
+):
+    """
+    Get an issue with its attachments, comments and logs in one response
+
+    Each sub-fetch runs on its own session so the four queries overlap
+    instead of paying DB latency one after another.
+    """
+    async def _fetch(loader):
+        async with AsyncSessionLocal() as session:
+            return await loader(session)
+
+    issue, attachments, comments, logs = await asyncio.gather(
+        _fetch(lambda s: get_issue_by_id(issue_id=issue_id, session=s)),
+        _fetch(lambda s: get_attachments_for_list(issue_id, s)),
+        _fetch(lambda s: get_comments_for_list(issue_id, s)),
+        _fetch(lambda s: get_logs_by_issue_id(issue_id=issue_id, session=s)),
+    )
+
+    if not issue:
+        raise NotFoundError(message="Issue not found", response_code=status.HTTP_404_NOT_FOUND)
+
+    return {
+        "success": True,
+        "message": "Issue detail fetched successfully",
+        "data": {
+            "issue": issue,
+            "attachments": attachments,
+            "comments": comments,
+            "logs": logs
+        }
+    }
+
 @issue_router.post("/")
 async def create_issue_api(
     request:CreateIssueRequest,
@@ -95,43 +182,20 @@ async def create_issue_api(
     if not created_issue:
         raise DatabaseErrors(message="Failed to create issue", response_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    if issue_data.get('assigned_to'):
-        user = await get_user_by_id(user_id=issue_data.get('assigned_to'), session=session)
-        if user:
-            issue = await get_issue_by_id(issue_id=created_issue.id, session=session)
-            Logger.info(f"Issue assigned mail sent to {user.email}")
-            await send_issue_assigned_mail(assigned_to=user, issue=issue, assigned_by=current_user)
-
-    # Convert SQLAlchemy model to dict for Redis publishing
-    issue_dict = {
-        "id": created_issue.id,
-        "name": created_issue.name,
-        "description": created_issue.description,
-        "status": created_issue.status.value if hasattr(created_issue.status, 'value') else str(created_issue.status),
-        "priority": created_issue.priority.value if hasattr(created_issue.priority, 'value') else str(created_issue.priority),
-        "type": created_issue.type.value if hasattr(created_issue.type, 'value') else str(created_issue.type),
-        "assigned_to": created_issue.assigned_to,
-        "assigned_by": created_issue.assigned_by,
-        "project_id": created_issue.project_id,
-        "sprint_id": created_issue.sprint_id,
-        "story_point": created_issue.story_point,
-        "time_estimate": float(created_issue.time_estimate) if created_issue.time_estimate else None,
-        "created_at": created_issue.created_at.isoformat() if created_issue.created_at else None,
-        "updated_at": created_issue.updated_at.isoformat() if created_issue.updated_at else None,
-    }
-    
+    # the post-create refresh already eager-loaded assignee (mapper-level
+    # selectin), so the mail needs no extra user or issue round trips
+    if issue_data.get('assigned_to') and created_issue.assignee:
+        Logger.info(f"Issue assigned mail sent to {created_issue.assignee.email}")
+        await send_issue_assigned_mail(assigned_to=created_issue.assignee, issue=created_issue, assigned_by=current_user)
+
+    # Convert SQLAlchemy model to dict for Redis publishing and the response
+    issue_dict = _issue_payload(created_issue)
+
     # publish issue update to redis pub/sub
     await redis_publisher.publish_issue_created(project_id=created_issue.project_id, issue_data=issue_dict)
 
     # Send Slack notification (non-blocking, errors are logged but not raised)
-    issue_notification_data = {
-        "id": created_issue.id,
-        "name": created_issue.name,
-        "description": created_issue.description,
-        "status": created_issue.status.value if hasattr(created_issue.status, 'value') else str(created_issue.status),
-        "priority": created_issue.priority.value if hasattr(created_issue.priority, 'value') else str(created_issue.priority),
-        "type": created_issue.type.value if hasattr(created_issue.type, 'value') else str(created_issue.type),
-    }
+    issue_notification_data = _issue_notification_data(created_issue)
     await send_slack_notification_for_issue(
         session=session,
         project_id=created_issue.project_id,
@@ -139,10 +203,12 @@ async def create_issue_api(
         issue_data=issue_notification_data
     )
 
+    # return the pre-serialized dict: orjson dumps it directly, with no
+    # jsonable_encoder reflection over the ORM instance
     return {
         "success": True,
         "message": "Issue created successfully",
-        "data": created_issue
+        "data": issue_dict
     }
 
 @issue_router.put("/{issue_id}")
@@ -161,62 +227,40 @@ async def update_issue_api(
     if issue_status and issue_status == IssueStatus.COMPLETED and current_user.role == Role.EMPLOYEE:
         raise PermissionDeniedError(message="You are not authorized to update issue status", response_code=status.HTTP_403_FORBIDDEN)
     
-    # Get the issue before updating to capture old status
+    # Get the issue before updating to capture its pre-update values;
+    # update_issue reuses this same loaded row, so no second SELECT
     old_issue = await get_issue_by_id(issue_id=issue_id, session=session)
     if not old_issue:
         raise NotFoundError(message="Issue not found", response_code=status.HTTP_404_NOT_FOUND)
-    
+
+    # capture scalars now: old_issue and the updated row are the same
+    # identity-mapped object once the update is applied
     old_status = old_issue.status.value if hasattr(old_issue.status, 'value') else str(old_issue.status)
-    
-    updated_issue = await update_issue(session=session, issue_id=issue_id, payload=issue_data)
+    old_priority = old_issue.priority.value if hasattr(old_issue.priority, 'value') else str(old_issue.priority)
+    old_assignee_name = old_issue.assignee.name if old_issue.assignee else "Unassigned"
+
+    updated_issue = await update_issue(session=session, issue_id=issue_id, payload=issue_data, issue=old_issue)
 
     if not updated_issue:
         raise DatabaseErrors(message="Failed to update issue", response_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
-    # Reload issue with all relationships for email
-    updated_issue = await get_issue_by_id(issue_id=issue_id, session=session)
-    if not updated_issue:
-        raise DatabaseErrors(message="Failed to reload updated issue", response_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
-    # Convert SQLAlchemy model to dict for Redis publishing
-    issue_dict = {
-        "id": updated_issue.id,
-        "name": updated_issue.name,
-        "description": updated_issue.description,
-        "status": updated_issue.status.value if hasattr(updated_issue.status, 'value') else str(updated_issue.status),
-        "priority": updated_issue.priority.value if hasattr(updated_issue.priority, 'value') else str(updated_issue.priority),
-        "type": updated_issue.type.value if hasattr(updated_issue.type, 'value') else str(updated_issue.type),
-        "assigned_to": updated_issue.assigned_to,
-        "assigned_by": updated_issue.assigned_by,
-        "project_id": updated_issue.project_id,
-        "sprint_id": updated_issue.sprint_id,
-        "story_point": updated_issue.story_point,
-        "time_estimate": float(updated_issue.time_estimate) if updated_issue.time_estimate else None,
-        "created_at": updated_issue.created_at.isoformat() if updated_issue.created_at else None,
-        "updated_at": updated_issue.updated_at.isoformat() if updated_issue.updated_at else None,
-        "assignee": {
-            "id": updated_issue.assignee.id,
-            "name": updated_issue.assignee.name
-        } if updated_issue.assignee else None,
-        "reporter": {
-            "id": updated_issue.reporter.id,
-            "name": updated_issue.reporter.name
-        } if updated_issue.reporter else None,
-    }
-    
+
+    # Convert SQLAlchemy model to dict for Redis publishing and the response
+    issue_dict = _issue_payload(updated_issue)
+
     # publish issue update to redis pub/sub
-    print(f"[ISSUE UPDATE] Publishing issue update to Redis for project {updated_issue.project_id}, issue {updated_issue.id}")
-    # Add updated_by information for notifications
-    issue_dict_with_user = {
-        **issue_dict,
-        "updated_by": {
-            "id": current_user.id,
-            "name": current_user.name,
-            "email": current_user.email
-        }
+    Logger.debug("Publishing issue update to Redis for project %s, issue %s", updated_issue.project_id, updated_issue.id)
+    # Add updated_by information for notifications; set it in place rather
+    # than rebuilding the whole dict, then drop it again for the response
+    issue_dict["updated_by"] = {
+        "id": current_user.id,
+        "name": current_user.name,
+        "email": current_user.email
     }
-    await redis_publisher.publish_issue_update(project_id=updated_issue.project_id, issue_data=issue_dict_with_user)
-    print(f"[ISSUE UPDATE] Published issue update to Redis for project {updated_issue.project_id}, issue {updated_issue.id}")
+    # start the publish now and let it overlap the Slack/mail work below;
+    # it shares no session, so only the final await orders it
+    publish_task = asyncio.create_task(
+        redis_publisher.publish_issue_update(project_id=updated_issue.project_id, issue_data=issue_dict)
+    )
 
     # Track changes for Slack notification
     changes = {}
@@ -224,26 +268,17 @@ async def update_issue_api(
         changes["status"] = {"old": old_status, "new": updated_issue.status.value}
     
     if "priority" in issue_data:
-        old_priority = old_issue.priority.value if hasattr(old_issue.priority, 'value') else str(old_issue.priority)
         new_priority = updated_issue.priority.value if hasattr(updated_issue.priority, 'value') else str(updated_issue.priority)
         if old_priority != new_priority:
             changes["priority"] = {"old": old_priority, "new": new_priority}
-    
+
     if "assigned_to" in issue_data:
-        old_assignee = old_issue.assignee.name if old_issue.assignee else "Unassigned"
         new_assignee = updated_issue.assignee.name if updated_issue.assignee else "Unassigned"
-        if old_assignee != new_assignee:
-            changes["assigned_to"] = {"old": old_assignee, "new": new_assignee}
+        if old_assignee_name != new_assignee:
+            changes["assigned_to"] = {"old": old_assignee_name, "new": new_assignee}
 
     # Send Slack notifications (non-blocking)
-    issue_notification_data = {
-        "id": updated_issue.id,
-        "name": updated_issue.name,
-        "description": updated_issue.description,
-        "status": updated_issue.status.value if hasattr(updated_issue.status, 'value') else str(updated_issue.status),
-        "priority": updated_issue.priority.value if hasattr(updated_issue.priority, 'value') else str(updated_issue.priority),
-        "type": updated_issue.type.value if hasattr(updated_issue.type, 'value') else str(updated_issue.type),
-    }
+    issue_notification_data = _issue_notification_data(updated_issue)
 
     # Send general update notification
     if changes:
@@ -280,21 +315,16 @@ async def update_issue_api(
 
     # Send status update email if status changed
     if issue_status and old_status != updated_issue.status.value:
+        # dedup by id with a set instead of rescanning the list per append
         recipients = []
-        
-        # Add assignee if exists
-        if updated_issue.assignee and updated_issue.assignee.id != current_user.id:
-            recipients.append(updated_issue.assignee)
-        
-        # Add reporter if exists and different from assignee and current user
-        if updated_issue.reporter:
-            if updated_issue.reporter.id != current_user.id and updated_issue.reporter.id != (updated_issue.assignee.id if updated_issue.assignee else None):
-                recipients.append(updated_issue.reporter)
-        
-        # Add current user if not already in recipients
-        if current_user.id not in [r.id for r in recipients]:
-            recipients.append(current_user)
-        
+        seen_ids = {current_user.id}
+        for user in (updated_issue.assignee, updated_issue.reporter):
+            if user and user.id not in seen_ids:
+                seen_ids.add(user.id)
+                recipients.append(user)
+        recipients.append(current_user)
+
+
         if recipients:
             await send_issue_status_update_mail(
                 issue=updated_issue,
@@ -302,12 +332,18 @@ async def update_issue_api(
                 updated_by=current_user,
                 recipients=recipients
             )
-    
+
+    await publish_task
+    Logger.debug("Published issue update to Redis for project %s, issue %s", updated_issue.project_id, updated_issue.id)
+    del issue_dict["updated_by"]
+
+    # return the pre-serialized dict: orjson dumps it directly, with no
+    # jsonable_encoder reflection over the ORM instance
     return {
         "success": True,
         "message": "Issue updated successfully",
-        "data": updated_issue
-    }   
+        "data": issue_dict
+    }
 
 @issue_router.delete("/{issue_id}")
 async def delete_issue_api(
@@ -318,16 +354,12 @@ async def delete_issue_api(
     """
     Delete an issue by id
     """
-    issue = await get_issue_by_id(issue_id=issue_id, session=session)
-    if not issue:
-        raise NotFoundError(message="Issue not found", response_code=status.HTTP_404_NOT_FOUND)
-
-    success = await delete_issue(session = session, issue_id = issue_id)
-    if not success:
-        raise DatabaseErrors(message="Failed to delete issue", response_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    # the CRUD delete raises NotFoundError itself and hands back the
+    # project_id, so no separate pre-read is needed for the publish
+    project_id = await delete_issue(session = session, issue_id = issue_id)
 
     # publish issue update to redis pub/sub
-    await redis_publisher.publish_issue_deleted(project_id=issue.project_id, issue_id=issue_id)
+    await redis_publisher.publish_issue_deleted(project_id=project_id, issue_id=issue_id)
 
     return {
         "success": True,
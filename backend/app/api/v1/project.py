@@ -6,12 +6,21 @@ from app.models.model import User
 from app.db.crud.project_crud import (
     get_all_projects,
     get_project_by_id,
+    get_project_team_members,
     create_project,
     update_project,
     delete_project
 )
+from app.cache.project_cache import (
+    get_cached_project,
+    set_cached_project,
+    invalidate_cached_project
+)
 from app.common.errors import NotFoundError, DatabaseErrors
 from app.schemas.project import ProjectRequest, ProjectUpdateRequest, GitHubRepoLinkRequest
+from app.core.redis_config import async_redis_client
+from app.services.github_webhook_service import REPO_PROJECT_KEY
+from app.utils.slack_notifier import invalidate_slack_config
 
 
 
@@ -118,7 +127,10 @@ async def update_project_api(
         
         if not project:
             raise DatabaseErrors(message="Failed to update project")
-        
+
+        await invalidate_cached_project(project_id)
+        invalidate_slack_config(project_id)
+
         return {
             "success": True,
             "message": "Project updated successfully",
@@ -148,6 +160,9 @@ async def delete_project_api(
     if not success:
         raise DatabaseErrors(message="Failed to delete project")
 
+    await invalidate_cached_project(project_id)
+    invalidate_slack_config(project_id)
+
     return {
         "success": True,
         "message":"Project deleted successfully",
@@ -190,7 +205,14 @@ async def link_github_repo(
             payload={'data': current_data},
             user_id=current_user.id
         )
-        
+
+        await invalidate_cached_project(project_id)
+        # the webhook path caches repo -> project; drop the mapping for
+        # the repo being (re)linked so events route to the new project
+        await async_redis_client.delete(
+            REPO_PROJECT_KEY.format(repo=request.github_repo)
+        )
+
         return {
             "success": True,
             "message": f"GitHub repository '{request.github_repo}' linked successfully",
@@ -215,4 +237,30 @@ async def get_all_team_members_api(
     """
     Get all team members of a project
     """
-    project = await get_project_by_id(project_id=project_id,user_id=current_user.id,session=session)
\ No newline at end of file
+    # Cache-first for the membership check; the member list itself is
+    # read fresh per request
+    project = await get_cached_project(project_id, current_user.id)
+    if project is None:
+        project = await get_project_by_id(project_id=project_id,user_id=current_user.id,session=session)
+        if project:
+            await set_cached_project(current_user.id, project)
+
+    if not project:
+        raise NotFoundError(message="Project not found")
+
+    team_members = await get_project_team_members(project_id=project_id,session=session)
+
+    # Serialize each user to dict and handle role enum
+    team_members_data = []
+    for member in team_members:
+        user_dict = member.to_dict()
+        role_value = user_dict.get("role")
+        if role_value and hasattr(role_value, "value"):
+            user_dict["role"] = role_value.value
+        team_members_data.append(user_dict)
+
+    return {
+        "success": True,
+        "message": "Team members retrieved successfully",
+        "data": team_members_data
+    }
\ No newline at end of file
@@ -2,7 +2,8 @@
 Slack API Endpoints
 Handles Slack webhook and notification operations
 """
-from fastapi import APIRouter, Depends, status
+import orjson
+from fastapi import APIRouter, Depends, Request, status
 from pydantic import BaseModel, Field
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +16,7 @@ from app.services.slack_service import SlackService
 from app.services.slack_notification_service import SlackNotificationService
 from app.common.errors import ClientErrors, NotFoundError
 from app.db.crud.project_crud import get_project_by_id
+from app.cache.project_cache import get_cached_project, set_cached_project
 from app.common.logging.logging_config import Logger
 from app.schemas.slack import TestWebhookRequest, SendNotificationRequest
 
@@ -92,11 +94,16 @@ async def test_project_slack_webhook(
     
     Tests the Slack integration configured for the project.
     """
-    project = await get_project_by_id(
-        project_id=project_id,
-        user_id=current_user.id,
-        session=session
-    )
+    # Cache-first: the test only reads the slack config out of data
+    project = await get_cached_project(project_id, current_user.id)
+    if project is None:
+        project = await get_project_by_id(
+            project_id=project_id,
+            user_id=current_user.id,
+            session=session
+        )
+        if project:
+            await set_cached_project(current_user.id, project)
 
     if not project:
         raise NotFoundError(message="Project not found")
@@ -124,18 +131,26 @@ async def test_project_slack_webhook(
 
 @slack_router.post("/webhook", status_code=status.HTTP_200_OK)
 async def slack_webhook(
-    payload: dict,
+    request: Request,
 ):
     """
     Receive webhook events from Slack (for future slash commands)
-    
+
     This endpoint can be used to handle Slack interactive components,
     slash commands, and other events.
-    
+
     Note: This endpoint does not require authentication as it receives
     webhooks from Slack. Signature verification should be added in production.
     """
-    Logger.info(f"Received Slack webhook: {payload}")
+    # Decode the raw body with orjson; skips FastAPI's dict validation and
+    # the stdlib json decode for possibly-large interactive payloads
+    body = await request.body()
+    try:
+        payload = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError:
+        raise ClientErrors(message="Invalid JSON payload")
+
+    Logger.debug("Received Slack webhook: %s", payload)
 
     # Future implementation for slash commands and interactive components
     return {
@@ -11,6 +11,7 @@ from datetime import datetime,timedelta
 from sqlalchemy import select,func
 from app.common.email_template import invite_email
 from app.core.security import hash_password
+from app.cache.user_cache import invalidate_cached_user
 from app.db.connection import get_db
 from app.db.crud.user import get_user_by_id
 from app.common.errors import NotFoundError,PermissionDeniedError
@@ -179,6 +180,9 @@ async def delete_user(
     await session.delete(user)
     await session.commit()
 
+    # drop the cached identity so the deleted user stops authenticating
+    await invalidate_cached_user(user_id)
+
     return {
         "message": f"User {user.email} deleted successfully."
     }
@@ -227,6 +231,11 @@ async def update_user(
         setattr(user,key,value)
     await session.commit()
     await session.refresh(user)
+
+    # drop the cached identity so role/status changes take effect now,
+    # not after the TTL
+    await invalidate_cached_user(user_id)
+
     return {
         "success": True,
         "message": "User updated successfully",
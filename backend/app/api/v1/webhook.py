@@ -1,25 +1,32 @@
-from fastapi import APIRouter, Request, Header, Depends
+import asyncio
+from uuid import uuid4
+
+from fastapi import APIRouter, Request, Header, status
 from app.core.conf import GITHUB_SECRET_KEY
 from app.core.security import verify_github_signature
+from app.core.redis_config import async_redis_client
 from app.common.errors import ClientErrors, ServerErrors, CredentialError
-from app.db.connection import get_db
-from app.services.github_webhook_service import GitHubWebhookService
+from app.tasks.github_webhook_task import (
+    process_github_event_task,
+    GITHUB_EVENT_KEY,
+    GITHUB_EVENT_TTL_SECONDS,
+)
 from app.common.logging.logging_config import Logger
-from sqlalchemy.ext.asyncio import AsyncSession
 
 webhook_router = APIRouter()
 
 
-@webhook_router.post("/github")
+@webhook_router.post("/github", status_code=status.HTTP_202_ACCEPTED)
 async def github_webhook(
     request: Request,
     x_hub_signature_256: str = Header(None, alias="X-Hub-Signature-256"),
-    session: AsyncSession = Depends(get_db)
 ):
     """
     GitHub webhook endpoint
-    Handles various GitHub events and integrates them with the project management system
-    
+    Verifies the signature, parks the raw payload in Redis and hands
+    processing to a Celery worker so the response returns immediately
+    (GitHub retries aggressively when deliveries are slow)
+
     Supported events:
     - push: Tracks commits and code pushes
     - pull_request: Creates/updates issues from PRs
@@ -29,46 +36,54 @@ async def github_webhook(
     try:
         # Get raw body for signature verification
         body = await request.body()
-        
-        # Verify the signature
-        # GitHub sends signature as string, convert to bytes if needed
+
+        # Verify the signature; the verifier handles the "sha256=" prefix
         if not x_hub_signature_256:
             Logger.warning("Missing GitHub webhook signature")
             raise CredentialError(message="Missing signature", response_code=401)
-        
-        signature_bytes = x_hub_signature_256.encode('utf-8') if isinstance(x_hub_signature_256, str) else x_hub_signature_256
-        if not await verify_github_signature(body, GITHUB_SECRET_KEY, signature_bytes):
+
+        if not await verify_github_signature(body, GITHUB_SECRET_KEY, x_hub_signature_256):
             Logger.warning("Invalid GitHub webhook signature")
             raise CredentialError(message="Invalid signature", response_code=401)
-        
-        # Parse payload
-        payload = await request.json()
+
         event_type = request.headers.get("X-GitHub-Event")
-        delivery_id = request.headers.get("X-GitHub-Delivery")
-        
+        delivery_id = request.headers.get("X-GitHub-Delivery") or uuid4().hex
+
         Logger.info(
             f"GitHub webhook received - Event: {event_type}, "
             f"Delivery ID: {delivery_id}"
         )
-        
-        # Process the webhook event
-        result = await GitHubWebhookService.process_webhook_event(
-            session=session,
-            event_type=event_type,
-            payload=payload
+
+        # SETNX on the delivery ID makes GitHub's redeliveries idempotent
+        first_delivery = await async_redis_client.set(
+            f"github:webhook:delivery:{delivery_id}",
+            "1",
+            nx=True,
+            ex=GITHUB_EVENT_TTL_SECONDS
+        )
+        if not first_delivery:
+            return {
+                'status': 'duplicate',
+                'event_type': event_type,
+                'delivery_id': delivery_id
+            }
+
+        await async_redis_client.set(
+            GITHUB_EVENT_KEY.format(delivery_id=delivery_id),
+            body,
+            ex=GITHUB_EVENT_TTL_SECONDS
         )
-        
-        # Return response
+        # .delay publishes to the broker over a blocking socket
+        await asyncio.to_thread(process_github_event_task.delay, delivery_id, event_type)
+
         return {
-            'status': 'success',
+            'status': 'accepted',
             'event_type': event_type,
-            'delivery_id': delivery_id,
-            'processing_result': result
+            'delivery_id': delivery_id
         }
-        
+
     except CredentialError:
         raise
     except Exception as e:
         Logger.error(f"Error processing GitHub webhook: {e}")
         raise ServerErrors(message=f"Error processing webhook: {str(e)}")
-    
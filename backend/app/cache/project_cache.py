@@ -0,0 +1,88 @@
+"""
+Redis-backed cache for per-user project lookups
+"""
+import orjson
+from datetime import date, datetime
+from typing import Optional
+
+from app.core.redis_config import async_redis_client
+from app.common.logging.logging_config import Logger
+from app.models.model import Project
+from app.core.enums import ProjectStatus
+
+# Keys are (project_id, user_id) so a hit also proves the user's
+# membership; the short TTL keeps post-update staleness bounded
+PROJECT_CACHE_TTL_SECONDS = 60
+
+
+def _cache_key(project_id: int, user_id: int) -> str:
+    return f"project:{project_id}:{user_id}"
+
+
+def project_cache_data(project: Project) -> dict:
+    """The column subset the read-only endpoints touch"""
+    return {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "status": project.status.value,
+        "created_by": project.created_by,
+        "start_date": project.start_date.isoformat() if project.start_date else None,
+        "end_date": project.end_date.isoformat() if project.end_date else None,
+        "data": project.data,
+        "organization_id": project.organization_id,
+        "created_at": project.created_at.isoformat() if project.created_at else None,
+        "updated_at": project.updated_at.isoformat() if project.updated_at else None,
+    }
+
+
+def _project_from_cache_data(data: dict) -> Project:
+    """
+    Rebuild a detached Project from cached fields.
+    The instance is never session-bound, so it only supports plain
+    attribute access on the cached columns.
+    """
+    return Project(
+        id=data["id"],
+        name=data["name"],
+        description=data["description"],
+        status=ProjectStatus(data["status"]),
+        created_by=data["created_by"],
+        start_date=date.fromisoformat(data["start_date"]) if data["start_date"] else None,
+        end_date=date.fromisoformat(data["end_date"]) if data["end_date"] else None,
+        data=data["data"],
+        organization_id=data["organization_id"],
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+    )
+
+
+async def get_cached_project(project_id: int, user_id: int) -> Optional[Project]:
+    """Get a detached cached project, or None on miss / Redis failure"""
+    try:
+        raw = await async_redis_client.get(_cache_key(project_id, user_id))
+    except Exception as e:
+        Logger.error(f"Error reading project {project_id} from cache: {e}")
+        return None
+    return _project_from_cache_data(orjson.loads(raw)) if raw else None
+
+
+async def set_cached_project(user_id: int, project: Project) -> None:
+    """Populate the cache; Redis failures never break the request"""
+    try:
+        await async_redis_client.set(
+            _cache_key(project.id, user_id),
+            orjson.dumps(project_cache_data(project)),
+            ex=PROJECT_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        Logger.error(f"Error caching project {project.id}: {e}")
+
+
+async def invalidate_cached_project(project_id: int) -> None:
+    """Drop every user's cached copy after a project mutation"""
+    try:
+        async for key in async_redis_client.scan_iter(match=f"project:{project_id}:*"):
+            await async_redis_client.delete(key)
+    except Exception as e:
+        Logger.error(f"Error invalidating cached project {project_id}: {e}")
@@ -0,0 +1,58 @@
+"""
+Redis-backed cache for user rows on the token refresh hot path
+"""
+import orjson
+from typing import Optional
+
+from app.core.redis_config import async_redis_client
+from app.common.logging.logging_config import Logger
+from app.models.model import User
+
+# Short TTL: mutation endpoints invalidate explicitly, so this only
+# bounds staleness for writes that bypass the API (e.g. manual SQL)
+USER_CACHE_TTL_SECONDS = 60
+
+
+def _cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def user_cache_data(user: User) -> dict:
+    """The subset of user fields the auth endpoints need"""
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "role": user.role.value,
+        "type_of_signup": user.type_of_signup.value
+    }
+
+
+async def get_cached_user(user_id: int) -> Optional[dict]:
+    """Get a cached user dict, or None on miss / Redis failure"""
+    try:
+        raw = await async_redis_client.get(_cache_key(user_id))
+    except Exception as e:
+        Logger.error(f"Error reading user {user_id} from cache: {e}")
+        return None
+    return orjson.loads(raw) if raw else None
+
+
+async def set_cached_user(user: User) -> None:
+    """Populate the cache; Redis failures never break the request"""
+    try:
+        await async_redis_client.set(
+            _cache_key(user.id),
+            orjson.dumps(user_cache_data(user)),
+            ex=USER_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        Logger.error(f"Error caching user {user.id}: {e}")
+
+
+async def invalidate_cached_user(user_id: int) -> None:
+    """Drop a cached user after any user-mutating operation"""
+    try:
+        await async_redis_client.delete(_cache_key(user_id))
+    except Exception as e:
+        Logger.error(f"Error invalidating cached user {user_id}: {e}")
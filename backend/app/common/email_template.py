@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import List
 
@@ -386,7 +387,9 @@ async def send_issue_assigned_mail(assigned_to: User, issue: Issue, assigned_by:
 </html>
 """
 
-    send_email_task.delay(
+    # .delay() publishes to the broker synchronously; keep it off the loop
+    await asyncio.to_thread(
+        send_email_task.delay,
         subject=subject,
         body=issue_assigned_email_body,
         to_email=[assigned_to.email],
@@ -656,7 +659,9 @@ async def send_issue_status_update_mail(issue: Issue, old_status: str, updated_b
     recipient_emails = [user.email for user in recipients if user and user.email]
     
     if recipient_emails:
-        send_email_task.delay(
+        # .delay() publishes to the broker synchronously; keep it off the loop
+        await asyncio.to_thread(
+            send_email_task.delay,
             subject=subject,
             body=status_update_email_body,
             to_email=recipient_emails,
@@ -7,4 +7,12 @@ celery_app = Celery(
     backend=CELERY_RESULT_BACKEND
 )
 
+# GitHub webhook processing gets its own queue so redelivery bursts
+# queue behind each other instead of starving email delivery (and vice
+# versa); workers can be sized per queue
+celery_app.conf.task_routes = {
+    "process_github_event_task": {"queue": "github_webhook"},
+    "deliver_slack_notification_task": {"queue": "slack_notifications"},
+}
+
 celery_app.autodiscover_tasks(["app.tasks"])
\ No newline at end of file
@@ -1,20 +1,60 @@
+import hashlib
+import time
+
 from fastapi import Depends, HTTPException, status, WebSocket
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import OperationalError, DisconnectionError
 from typing import Optional
+from cachetools import TTLCache
 from app.db.connection import get_db
 from app.db.crud.user import get_user_by_id
+from app.cache.user_cache import get_cached_user, set_cached_user, user_cache_data
 from app.core.security import decode_token
 from app.models.model import User
 from app.common.errors import CredentialError,PermissionDeniedError,DatabaseErrors
-from app.core.enums import Role
+from app.core.enums import Role,TypeOfSignup
 from typing import List
 from fastapi import WebSocket
 
 
 security = HTTPBearer(auto_error=False)  # Set auto_error to False to handle missing credentials manually
 
+# Process-local cache in front of Redis to coalesce request bursts within one
+# worker; the short TTL keeps cross-worker staleness negligible
+_local_user_cache = TTLCache(maxsize=10000, ttl=5)
+
+# Decoded JWT claims keyed by a blake2b digest of the raw token, so a
+# client's request burst verifies the HMAC signature once, not per call
+_token_cache = TTLCache(maxsize=50000, ttl=30)
+
+
+def _decode_token_cached(token: str) -> dict:
+    """decode_token with a short per-process claims cache"""
+    hkey = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(hkey)
+    # the cache TTL may outlive the token's own exp; honor exp on hits
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+    payload = decode_token(token)
+    _token_cache[hkey] = payload
+    return payload
+
+
+def _user_from_cache_data(data: dict) -> User:
+    """
+    Rebuild a detached User from cached fields.
+    The instance is never session-bound, so it only supports the plain
+    attribute access the endpoints perform (id/name/email/role).
+    """
+    return User(
+        id=data["id"],
+        name=data["name"],
+        email=data["email"],
+        role=Role(data["role"]),
+        type_of_signup=TypeOfSignup(data["type_of_signup"])
+    )
+
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),  # Make credentials optional
     session: AsyncSession = Depends(get_db)
@@ -28,22 +68,31 @@ async def get_current_user(
     token = credentials.credentials
     
     try:
-        print("token is------",credentials)
-        token = credentials.credentials
-    
-        # Decode token
-        payload = decode_token(token)
+        # Decode token (cached per process for repeat requests)
+        payload = _decode_token_cached(token)
         user_id = payload.get("user_id")
         
         if not user_id:
             raise CredentialError(message="Invalid token: user_id not found")
-        
+
+        # Cache-first: local TTL cache, then Redis, then the database
+        cached = _local_user_cache.get(user_id)
+        if cached is None:
+            cached = await get_cached_user(user_id)
+            if cached:
+                _local_user_cache[user_id] = cached
+        if cached:
+            return _user_from_cache_data(cached)
+
         # Get user from database
         user = await get_user_by_id(user_id=user_id, session=session)
-        
+
         if not user:
             raise CredentialError(message="User not found")
-        
+
+        _local_user_cache[user_id] = user_cache_data(user)
+        await set_cached_user(user)
+
         return user
     except CredentialError:
         # Re-raise CredentialError as-is (will return 401)
@@ -76,12 +125,20 @@ async def get_current_user(
 # ----------------------------------------------------------------------------------------------
 # ROLE CHECKER
 # ----------------------------------------------------------------------------------------------
-ROLE_RANK = {
-    Role.ADMIN: 3,
-    Role.MANAGER:2,
-    Role.EMPLOYEE: 1,   
+# Hierarchy low to high; each role gets one bit and every min_role
+# collapses into a precomputed mask of the roles at or above it, so the
+# per-request check is a single int AND instead of two rank lookups
+_ROLE_ORDER = (Role.EMPLOYEE, Role.MANAGER, Role.ADMIN)
+_ROLE_BIT = {role: 1 << rank for rank, role in enumerate(_ROLE_ORDER)}
+_ALLOWED_MASK = {
+    role: sum(_ROLE_BIT[higher] for higher in _ROLE_ORDER[rank:])
+    for rank, role in enumerate(_ROLE_ORDER)
 }
 
+# One checker per min_role, so every route sharing a min_role gets the
+# same callable and FastAPI can cache the dependency within a request
+_role_checkers = {}
+
 def allow_min_role(min_role: Role):
     """
     Allows users with this role OR HIGHER in hierarchy
@@ -90,19 +147,22 @@ def allow_min_role(min_role: Role):
         -> allowed: MANAGER, ADMIN
         -> denied: USER
     """
+    checker = _role_checkers.get(min_role)
+    if checker is not None:
+        return checker
 
-    async def checker(current_user: User = Depends(get_current_user)):
+    allowed_mask = _ALLOWED_MASK[min_role]
 
-        user_role_rank = ROLE_RANK.get(current_user.role, 0)
-        min_role_rank = ROLE_RANK[min_role]
+    async def checker(current_user: User = Depends(get_current_user)):
 
-        if user_role_rank < min_role_rank:
+        if not (_ROLE_BIT.get(current_user.role, 0) & allowed_mask):
             raise PermissionDeniedError(
                 message="You are not authorized to access this resource"
             )
 
         return current_user
 
+    _role_checkers[min_role] = checker
     return checker
 
 # ----------------------------------------------------------------------------------------------
@@ -13,13 +13,29 @@ redis_client = Redis(
     decode_responses=True
 )
 
-# Async redis client for async operations (Pub/Sub)
-async_redis_client = redis.Redis(
+_async_connection_kwargs = dict(
     host=REDIS_HOST,
     port=REDIS_PORT,
-    username=REDIS_USERNAME,  # Add this
+    username=REDIS_USERNAME,
     password=REDIS_PASSWORD,
-    ssl=REDIS_USE_SSL,  # Add this
-    ssl_cert_reqs=None,  # Add this for self-signed certs
-    decode_responses=True
-)
\ No newline at end of file
+    health_check_interval=30,
+)
+if REDIS_USE_SSL:
+    _async_connection_class = redis.SSLConnection
+    _async_connection_kwargs["ssl_cert_reqs"] = None  # for self-signed certs
+else:
+    _async_connection_class = redis.Connection
+
+# Bounded blocking pool shared by every async caller: bursts wait up to
+# `timeout` seconds for a free connection instead of opening unbounded
+# sockets, and health checks retire dead connections before reuse
+async_redis_pool = redis.BlockingConnectionPool(
+    connection_class=_async_connection_class,
+    max_connections=64,
+    timeout=5,
+    **_async_connection_kwargs
+)
+
+# decode_responses stays off so publishers can hand pre-encoded bytes to
+# the socket; readers (json/orjson) accept bytes directly
+async_redis_client = redis.Redis(connection_pool=async_redis_pool)
@@ -1,7 +1,10 @@
+import asyncio
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, VerificationError, InvalidHashError
 from typing import Optional
 from datetime import datetime,timedelta
-from jose import jwt, JWTError
+from jose import jwt, jwk, JWTError
 from app.core.conf import JWT_SECRET_KEY,JWT_ACCESS_TOKEN_EXPIRE_MINUTES,JWT_ALGORITHM,JWT_REFRESH_TOKEN_EXPIRE_MINUTES,GOOGLE_CLIENT_ID
 from app.common.logging.logging_config import Logger
 from app.common.errors import ServerErrors,ClientErrors
@@ -10,18 +13,38 @@ from google.oauth2 import id_token
 import hmac
 import hashlib
 
+# Build the HMAC signing key once at import; jose skips per-call key
+# construction when encode/decode receive a prebuilt Key instance
+_SIGNING_KEY = jwk.construct(JWT_SECRET_KEY, JWT_ALGORITHM) if JWT_SECRET_KEY else None
+
+# Argon2id with 4 lanes: unlike bcrypt's serial key schedule, the lanes
+# hash in parallel on multi-core servers; it is also memory-hard
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64*1024, parallelism=4)
+
 async def hash_password(password:str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'),bcrypt.gensalt(rounds=10)).decode('utf-8')
+    # hashing is CPU/memory-bound, run it off the event loop so concurrent
+    # requests are not blocked while it runs
+    return await asyncio.to_thread(_password_hasher.hash, password)
 
 async def verify_password(password:str,hashed_password:str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'),hashed_password.encode('utf-8'))
+    # legacy bcrypt hashes ($2...) keep verifying until rehashed on login
+    if hashed_password.startswith("$2"):
+        return await asyncio.to_thread(
+            bcrypt.checkpw,
+            password.encode('utf-8'),
+            hashed_password.encode('utf-8')
+        )
+    try:
+        return await asyncio.to_thread(_password_hasher.verify, hashed_password, password)
+    except (VerifyMismatchError, VerificationError, InvalidHashError):
+        return False
 
     
 async def create_access_token(data:dict,expires_minute:Optional[int] = None) -> str:
 
-    if not JWT_SECRET_KEY:
+    if not _SIGNING_KEY:
         raise ServerErrors(message="JWT_SECRET_KEY is not configured. Please contact administrator.")
-    
+
     to_encode = data.copy()
     expires_minutes = expires_minute if expires_minute else JWT_ACCESS_TOKEN_EXPIRE_MINUTES
     expire = datetime.utcnow() + timedelta(minutes=expires_minutes)
@@ -29,15 +52,15 @@ async def create_access_token(data:dict,expires_minute:Optional[int] = None) ->
     to_encode.update({
         "exp":expire
     })
-    token= jwt.encode(to_encode,JWT_SECRET_KEY,algorithm=JWT_ALGORITHM)
+    token= jwt.encode(to_encode,_SIGNING_KEY,algorithm=JWT_ALGORITHM)
     return token
 
     
 async def create_refresh_token(data:dict,expires_minute:Optional[int] = None) -> str:
 
-    if not JWT_SECRET_KEY:
+    if not _SIGNING_KEY:
         raise ServerErrors(message="JWT_SECRET_KEY is not configured. Please contact administrator.")
-    
+
     to_encode = data.copy()
     expires_minutes = expires_minute if expires_minute else JWT_REFRESH_TOKEN_EXPIRE_MINUTES
     expire = datetime.utcnow() + timedelta(minutes=expires_minutes)
@@ -45,7 +68,7 @@ async def create_refresh_token(data:dict,expires_minute:Optional[int] = None) ->
     to_encode.update({
         "exp":expire
     })
-    token= jwt.encode(to_encode,JWT_SECRET_KEY,algorithm=JWT_ALGORITHM)
+    token= jwt.encode(to_encode,_SIGNING_KEY,algorithm=JWT_ALGORITHM)
     return token
 
 
@@ -56,38 +79,42 @@ def decode_token(token: str) -> dict:
     Raises ValueError for token-related errors (will be caught and converted to CredentialError in dependencies)
     Raises ServerErrors for configuration errors
     """
-    if not JWT_SECRET_KEY:
+    if not _SIGNING_KEY:
         raise ServerErrors(message="JWT_SECRET_KEY is not configured. Please contact administrator.")
-    
+
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[JWT_ALGORITHM])
         return payload
     except jwt.ExpiredSignatureError:
         raise ValueError("Token has expired")
     except jwt.JWTError:
         raise ValueError("Invalid token")
 
-async def verify_github_signature(body:bytes,secret_key:str,x_hub_signature_256:bytes) -> bool:
+async def verify_github_signature(body:bytes,secret_key:str,x_hub_signature_256:str) -> bool:
     """
     Verify GitHub signature
 
     Args:
-        body (bytes): The body of the request
+        body (bytes): The raw body of the request
         secret_key (str): The secret key for the GitHub webhook
+        x_hub_signature_256 (str): The X-Hub-Signature-256 header ("sha256=<hex>")
 
     Returns:
         bool: True if signature is valid, False otherwise
     """
-    
-    signature = "sha256="+ hmac.new(
-        secret_key.encode('utf-8'),
-        body,
-        hashlib.sha256
-        
-    ).hexdigest()
-    
-    
-    return hmac.compare_digest(signature.encode('utf-8'),x_hub_signature_256)
+
+    scheme, _, signature_hex = x_hub_signature_256.partition('=')
+    if scheme != 'sha256':
+        return False
+
+    expected = hmac.new(secret_key.encode('utf-8'), body, hashlib.sha256).digest()
+
+    # compare raw digests in constant time - skips the hexdigest encode
+    # and prefix concat on every delivery
+    try:
+        return hmac.compare_digest(expected, bytes.fromhex(signature_hex))
+    except ValueError:
+        return False
 
 
 async def verify_google_token(id_token_str) -> dict:
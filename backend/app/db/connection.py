@@ -1,17 +1,31 @@
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from app.core.conf import DATABASE_URL, DEBUG 
+from app.core.conf import DATABASE_URL, DEBUG
 
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,            # Enable SQL logging in debug mode
     future=True,
-    pool_size=5,           # max persistent connections (reduced to prevent connection exhaustion)
-    max_overflow=5,        # allow temporary burst (reduced to prevent connection exhaustion)
+    pool_size=20,          # max persistent connections (sized for concurrent request load)
+    max_overflow=40,       # allow temporary burst without queueing on checkout
     pool_timeout=30,       # fail fast instead of hanging
     pool_recycle=1800,     # recycle connections after 30 minutes
     pool_pre_ping=True,    # verify connections before using (prevents stale connections)
+    pool_use_lifo=True,    # reuse hot connections first so idle ones age out
+    query_cache_size=1200, # room for every hoisted statement without LRU churn
+    # JSONB columns (project/org/sprint data) encode and decode through
+    # orjson's C path instead of stdlib json
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
+    connect_args={
+        "statement_cache_size": 1024,  # asyncpg prepared-statement cache per connection
+        "server_settings": {
+            "jit": "off",              # JIT compile overhead never pays off for short OLTP queries
+            "application_name": "zyro",
+        },
+    },
 )
 
 # Create async session factory
@@ -19,7 +33,7 @@ AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
-  
+    autoflush=False,       # CRUD flushes explicitly before reading ids; skips a flush check per read
 )
 
 # Base class for models
@@ -2,13 +2,23 @@
 CRUD operations for attachments
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, insert, delete, or_, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, load_only, raiseload
 from typing import List, Optional
 
 from app.models.model import Attachment, Issue, User
 from app.common.errors import NotFoundError, ClientErrors
 
+# Postgres error code for foreign_key_violation
+_FK_VIOLATION = "23503"
+
+
+def _is_fk_violation(error: IntegrityError) -> bool:
+    orig = error.orig
+    return getattr(orig, "pgcode", None) == _FK_VIOLATION or \
+        getattr(orig, "sqlstate", None) == _FK_VIOLATION
+
 
 async def get_attachments_by_issue_id(
     issue_id: int,
@@ -20,7 +30,11 @@ async def get_attachments_by_issue_id(
     stmt = select(Attachment).where(
         Attachment.issue_id == issue_id
     ).options(
-        selectinload(Attachment.uploader)
+        # responses only read the uploader's name; keep the user rows
+        # narrow instead of dragging every column across the wire
+        selectinload(Attachment.uploader).options(load_only(User.name)),
+        # anything not loaded explicitly should fail loudly, not lazy-load
+        raiseload("*")
     ).order_by(
         Attachment.created_at.desc()
     )
@@ -30,6 +44,57 @@ async def get_attachments_by_issue_id(
     return list(attachments)
 
 
+def attachments_for_list_stmt(issue_id: int):
+    """
+    The flat column select behind the attachment list endpoints
+
+    Shared between the materializing fetch and the streaming variant so
+    both return identically shaped rows.
+    """
+    return select(
+        Attachment.id,
+        Attachment.issue_id,
+        Attachment.file_name,
+        Attachment.file_size,
+        Attachment.file_type,
+        Attachment.file_url,
+        Attachment.uploaded_by,
+        User.name.label("uploader_name"),
+        Attachment.created_at,
+        Attachment.updated_at
+    ).join(
+        User, Attachment.uploaded_by == User.id
+    ).where(
+        Attachment.issue_id == issue_id
+    ).order_by(
+        Attachment.created_at.desc()
+    )
+
+
+async def get_attachments_for_list(
+    issue_id: int,
+    session: AsyncSession
+) -> List[dict]:
+    """
+    Get all attachments for an issue as plain mappings (no ORM hydration)
+
+    Selects only the scalar columns the list response needs, joined with
+    the uploader row, keyed to match AttachmentResponse field names.
+    """
+    result = await session.execute(attachments_for_list_stmt(issue_id))
+    return result.mappings().all()
+
+
+# Hoisted to module level so the compiled-statement cache key is the
+# same object on every call
+_GET_ATTACHMENT_BY_ID = select(Attachment).where(
+    Attachment.id == bindparam("attachment_id")
+).options(
+    selectinload(Attachment.uploader).options(load_only(User.name)),
+    selectinload(Attachment.issue)
+)
+
+
 async def get_attachment_by_id(
     attachment_id: int,
     session: AsyncSession
@@ -37,14 +102,25 @@ async def get_attachment_by_id(
     """
     Get an attachment by ID
     """
-    stmt = select(Attachment).where(
-        Attachment.id == attachment_id
-    ).options(
-        selectinload(Attachment.uploader),
-        selectinload(Attachment.issue)
+    result = await session.execute(
+        _GET_ATTACHMENT_BY_ID, {"attachment_id": attachment_id}
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_attachment_public_id(
+    attachment_id: int,
+    session: AsyncSession
+) -> Optional[str]:
+    """
+    Get just an attachment's Cloudinary public_id
+
+    The delete path only needs this one column; loading the full row
+    would also drag in the uploader and issue selectin loads.
+    """
+    result = await session.execute(
+        select(Attachment.cloudinary_public_id).where(Attachment.id == attachment_id)
     )
-    
-    result = await session.execute(stmt)
     return result.scalar_one_or_none()
 
 
@@ -61,14 +137,6 @@ async def create_attachment(
     """
     Create a new attachment record
     """
-    # Verify issue exists
-    issue_stmt = select(Issue).where(Issue.id == issue_id)
-    issue_result = await session.execute(issue_stmt)
-    issue = issue_result.scalar_one_or_none()
-    
-    if not issue:
-        raise NotFoundError(message="Issue not found")
-    
     attachment = Attachment(
         issue_id=issue_id,
         file_name=file_name,
@@ -78,13 +146,54 @@ async def create_attachment(
         cloudinary_public_id=cloudinary_public_id,
         uploaded_by=uploaded_by
     )
-    
+
+    # no existence probe: the issue_id FK enforces it on INSERT, and the
+    # violation is translated back into the same NotFoundError
     session.add(attachment)
-    await session.commit()
-    await session.refresh(attachment)
-    
-    # Reload with relationships
-    return await get_attachment_by_id(attachment.id, session)
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if _is_fk_violation(e):
+            raise NotFoundError(message="Issue not found")
+        raise
+    # nothing to reload: the INSERT's RETURNING already populated the
+    # server-side timestamps (eager defaults), the session does not
+    # expire on commit, and the caller holds the uploader already
+    return attachment
+
+
+async def create_attachments_bulk(
+    session: AsyncSession,
+    rows: List[dict]
+) -> None:
+    """
+    Insert many attachment records in one executemany round trip
+
+    Each row dict carries the same keys create_attachment takes
+    (issue_id, file_name, file_size, file_type, file_url,
+    cloudinary_public_id, uploaded_by). Intended for batched imports;
+    the caller owns the commit.
+    """
+    if not rows:
+        return
+
+    await session.execute(insert(Attachment), rows)
+    await session.flush()
+
+
+async def count_attachments_by_public_id(
+    cloudinary_public_id: str,
+    session: AsyncSession
+) -> int:
+    """
+    Count attachment rows referencing a Cloudinary public_id
+    """
+    stmt = select(func.count()).select_from(Attachment).where(
+        Attachment.cloudinary_public_id == cloudinary_public_id
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one()
 
 
 async def delete_attachment(
@@ -96,24 +205,26 @@ async def delete_attachment(
     Delete an attachment
     Only the uploader or issue assignee can delete
     """
-    attachment = await get_attachment_by_id(attachment_id, session)
-    
-    if not attachment:
-        raise NotFoundError(message="Attachment not found")
-    
-    # Check permissions: uploader or issue assignee
-    if attachment.uploaded_by != user_id:
-        # Check if user is assignee of the issue
-        issue_stmt = select(Issue).where(Issue.id == attachment.issue_id)
-        issue_result = await session.execute(issue_stmt)
-        issue = issue_result.scalar_one_or_none()
-        
-        if not issue or issue.assigned_to != user_id:
-            raise ClientErrors(message="You don't have permission to delete this attachment")
-    
-    # Delete from Cloudinary (handled in API layer)
-    # Delete from database
-    await session.delete(attachment)
+    # authorization folded into the DELETE itself; only the failure path
+    # pays a probe to tell missing apart from forbidden
+    result = await session.execute(
+        delete(Attachment).where(
+            Attachment.id == attachment_id,
+            or_(
+                Attachment.uploaded_by == user_id,
+                Attachment.issue.has(Issue.assigned_to == user_id)
+            )
+        )
+    )
     await session.commit()
-    
+
+    if result.rowcount == 0:
+        probe = await session.execute(
+            select(Attachment.id).where(Attachment.id == attachment_id)
+        )
+        if probe.scalar_one_or_none() is None:
+            raise NotFoundError(message="Attachment not found")
+        raise ClientErrors(message="You don't have permission to delete this attachment")
+
+    # Delete from Cloudinary (handled in API layer)
     return True
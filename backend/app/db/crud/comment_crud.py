@@ -2,12 +2,14 @@
 CRUD operations for comments
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, delete, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, load_only, raiseload
 from typing import List, Optional
 
 from app.models.model import Comment, Issue, User
 from app.common.errors import NotFoundError, ClientErrors
+from app.db.crud.attachment_crud import _is_fk_violation
 
 
 async def get_comments_by_issue_id(
@@ -20,7 +22,11 @@ async def get_comments_by_issue_id(
     stmt = select(Comment).where(
         Comment.issue_id == issue_id
     ).options(
-        selectinload(Comment.user)
+        # responses only read the author's name/email; keep the user
+        # rows narrow instead of dragging every column across the wire
+        selectinload(Comment.user).options(load_only(User.name, User.email)),
+        # anything not loaded explicitly should fail loudly, not lazy-load
+        raiseload("*")
     ).order_by(
         Comment.created_at.asc()
     )
@@ -30,6 +36,48 @@ async def get_comments_by_issue_id(
     return list(comments)
 
 
+async def get_comments_for_list(
+    issue_id: int,
+    session: AsyncSession
+) -> List[dict]:
+    """
+    Get all comments for an issue as plain mappings (no ORM hydration)
+
+    Selects only the scalar columns the list response needs, joined with
+    the author row, keyed to match CommentResponse field names.
+    """
+    stmt = select(
+        Comment.id,
+        Comment.issue_id,
+        Comment.user_id,
+        User.name.label("user_name"),
+        User.email.label("user_email"),
+        Comment.content,
+        Comment.edited,
+        Comment.created_at,
+        Comment.updated_at
+    ).join(
+        User, Comment.user_id == User.id
+    ).where(
+        Comment.issue_id == issue_id
+    ).order_by(
+        Comment.created_at.asc()
+    )
+
+    result = await session.execute(stmt)
+    return result.mappings().all()
+
+
+# Hoisted to module level so the compiled-statement cache key is the
+# same object on every call
+_GET_COMMENT_BY_ID = select(Comment).where(
+    Comment.id == bindparam("comment_id")
+).options(
+    selectinload(Comment.user).options(load_only(User.name, User.email)),
+    selectinload(Comment.issue)
+)
+
+
 async def get_comment_by_id(
     comment_id: int,
     session: AsyncSession
@@ -37,14 +85,9 @@ async def get_comment_by_id(
     """
     Get a comment by ID
     """
-    stmt = select(Comment).where(
-        Comment.id == comment_id
-    ).options(
-        selectinload(Comment.user),
-        selectinload(Comment.issue)
+    result = await session.execute(
+        _GET_COMMENT_BY_ID, {"comment_id": comment_id}
     )
-    
-    result = await session.execute(stmt)
     return result.scalar_one_or_none()
 
 
@@ -57,27 +100,29 @@ async def create_comment(
     """
     Create a new comment
     """
-    # Verify issue exists
-    issue_stmt = select(Issue).where(Issue.id == issue_id)
-    issue_result = await session.execute(issue_stmt)
-    issue = issue_result.scalar_one_or_none()
-    
-    if not issue:
-        raise NotFoundError(message="Issue not found")
-    
-    comment = Comment(
+    # single INSERT ... RETURNING hands back the full row - id and
+    # server-side timestamps included - in one round trip; no existence
+    # probe either, the issue_id FK enforces it and the violation is
+    # translated back into the same NotFoundError
+    stmt = insert(Comment).values(
         issue_id=issue_id,
         user_id=user_id,
         content=content,
         edited=False
-    )
-    
-    session.add(comment)
-    await session.commit()
-    await session.refresh(comment)
-    
-    # Reload with relationships
-    return await get_comment_by_id(comment.id, session)
+    ).returning(Comment)
+
+    try:
+        result = await session.execute(stmt)
+        comment = result.scalars().one()
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if _is_fk_violation(e):
+            raise NotFoundError(message="Issue not found")
+        raise
+    # usable after commit: the session does not expire on commit, and
+    # the caller holds the author already
+    return comment
 
 
 async def update_comment(
@@ -103,10 +148,9 @@ async def update_comment(
     
     session.add(comment)
     await session.commit()
+    # the row came in fully loaded; refresh just picks up updated_at
     await session.refresh(comment)
-    
-    # Reload with relationships
-    return await get_comment_by_id(comment.id, session)
+    return comment
 
 
 async def delete_comment(
@@ -118,15 +162,22 @@ async def delete_comment(
     Delete a comment
     Only the comment author can delete
     """
-    comment = await get_comment_by_id(comment_id, session)
-    
-    if not comment:
-        raise NotFoundError(message="Comment not found")
-    
-    if comment.user_id != user_id:
-        raise ClientErrors(message="You can only delete your own comments")
-    
-    await session.delete(comment)
+    # authorization folded into the DELETE itself; only the failure path
+    # pays a probe to tell missing apart from forbidden
+    result = await session.execute(
+        delete(Comment).where(
+            Comment.id == comment_id,
+            Comment.user_id == user_id
+        )
+    )
     await session.commit()
-    
+
+    if result.rowcount == 0:
+        probe = await session.execute(
+            select(Comment.id).where(Comment.id == comment_id)
+        )
+        if probe.scalar_one_or_none() is None:
+            raise NotFoundError(message="Comment not found")
+        raise ClientErrors(message="You can only delete your own comments")
+
     return True
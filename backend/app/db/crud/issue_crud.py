@@ -1,10 +1,11 @@
 from app.models.model import Issue, Sprint, Project, ProjectMember
 from app.core.enums import IssueStatus
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, or_, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, raiseload
 
-from typing import List
+from typing import List, Optional
 from app.db.crud.project_crud import get_project_by_id
 from app.common.errors import NotFoundError,ClientErrors
 async def get_all_active_issues(user_id: int, session: AsyncSession) -> List[Issue]:
@@ -49,7 +50,8 @@ async def get_all_issues(user_id: int, session: AsyncSession) -> List[Issue]:
         selectinload(Issue.assignee),
         selectinload(Issue.reporter),
         selectinload(Issue.project),
-        selectinload(Issue.sprint)
+        selectinload(Issue.sprint),
+        raiseload("*")
     ).order_by(
         Issue.updated_at.desc()
     )
@@ -102,49 +104,102 @@ async def create_issue(session:AsyncSession,user_id:int,payload:dict) -> Issue:
     await session.refresh(issue)
     return issue 
 
+async def upsert_github_issue(session: AsyncSession, issue_data: dict) -> int:
+    """
+    Create or update an issue mirrored from a GitHub webhook event
+
+    One INSERT ... ON CONFLICT DO UPDATE keyed on the partial unique
+    index (project_id, github_issue_number, is_github_pr) replaces the
+    old find-then-create/update pair of round-trips. Returns the issue
+    id. issue_data must include github_issue_number and is_github_pr.
+    """
+    stmt = pg_insert(Issue).values(**issue_data).on_conflict_do_update(
+        index_elements=['project_id', 'github_issue_number', 'is_github_pr'],
+        index_where=Issue.github_issue_number.isnot(None),
+        set_={
+            'name': issue_data['name'],
+            'description': issue_data['description'],
+            'status': issue_data['status'],
+            'type': issue_data['type'],
+            'priority': issue_data['priority'],
+            # the ORM-level onupdate does not fire on raw statements
+            'updated_at': func.now(),
+        }
+    ).returning(Issue.id)
+
+    result = await session.execute(stmt)
+    issue_id = result.scalar_one()
+    await session.commit()
+    return issue_id
+
+
 async def update_issue(
     session:AsyncSession,
     issue_id:int,
     payload:dict,
+    issue:Optional[Issue] = None,
 ) -> Issue:
     """
     Update an issue by id
+
+    Callers that already fetched the row (e.g. to capture pre-update
+    values) can pass it in to skip the second SELECT.
     """
-    issue = await get_issue_by_id(issue_id=issue_id,session=session)
+    if issue is None or issue.id != issue_id:
+        issue = await get_issue_by_id(issue_id=issue_id,session=session)
     if not issue:
         raise NotFoundError(message = "Issue not found")
 
     for key, value in payload.items():
         setattr(issue, key, value)
-    
+
     session.add(issue)
     await session.commit()
-    await session.refresh(issue)
+
+    # updated_at is a SQL-expression onupdate, so the flush expires it
+    # (eager_defaults only RETURNINGs server values on INSERT) and a
+    # later attribute read would lazy-load and blow up on AsyncSession.
+    # Refresh it plus any relationships the payload retargeted, instead
+    # of reloading the whole row.
+    stale = ["updated_at"] + [rel for rel, fk in (
+        ("assignee","assigned_to"),
+        ("sprint","sprint_id"),
+        ("project","project_id"),
+    ) if fk in payload]
+    await session.refresh(issue, stale)
+
     return issue
 
-async def delete_issue(session:AsyncSession,issue_id:int)->bool:
+async def delete_issue(session:AsyncSession,issue_id:int)->int:
     """
     Function to Delete an issue by id
+
+    Returns the deleted issue's project_id so the caller can publish the
+    deletion without a separate pre-read.
     """
-    issue = await get_issue_by_id(issue_id=issue_id,session=session)
-    if not issue:
+    # one DELETE; ON DELETE CASCADE removes logs, comments, attachments
+    # and sub-issues in the database instead of loading them here
+    result = await session.execute(
+        delete(Issue).where(Issue.id == issue_id).returning(Issue.project_id)
+    )
+    project_id = result.scalar_one_or_none()
+    if project_id is None:
         raise NotFoundError(message="Issue not found")
 
-    await session.delete(issue)
     await session.commit()
-    return True
+    return project_id
 
 async def get_user_issues(user_id:int,session:AsyncSession) -> List[Issue]:
     """
     Get all issues for a user
     """
-    # stmt = select(Issue).where(Issue.assigned_to == user_id).options(
-    #     selectinload(Issue.assignee),
-    #     selectinload(Issue.reporter),
-    #     selectinload(Issue.project),
-    #     selectinload(Issue.sprint)
-    # )
-    stmt = select(Issue).where(Issue.assigned_to == user_id)
+    stmt = select(Issue).where(Issue.assigned_to == user_id).options(
+        selectinload(Issue.assignee),
+        selectinload(Issue.reporter),
+        selectinload(Issue.project),
+        selectinload(Issue.sprint),
+        raiseload("*")
+    )
     result = await session.execute(stmt)
     issues = result.scalars().all()
     return list(issues)
@@ -4,15 +4,17 @@ from sqlalchemy import select
 from typing import List,Optional
 from app.common.errors import NotFoundError
 
-async def get_user_logs(user_id:int,session:AsyncSession) -> List[Logs]:
+async def get_user_logs(user_id:int,session:AsyncSession) -> List[dict]:
     """
     function to get all logs for the current user
+
+    Read-only list: selects the table directly and returns row mappings,
+    skipping ORM hydration per row.
     """
 
-    stmt = select(Logs).where(Logs.user_id == user_id)
-    logs = await session.execute(stmt)
-    logs = list(logs.scalars().all())
-    return logs
+    stmt = select(Logs.__table__).where(Logs.user_id == user_id)
+    result = await session.execute(stmt)
+    return list(result.mappings().all())
 
 async def get_log_by_id(log_id:int,session:AsyncSession) -> Optional[Logs]:
     """
@@ -66,13 +68,15 @@ async def delete_log(log_id:int,session:AsyncSession) -> bool:
     await session.commit()
     return True
 
-async def get_logs_by_issue_id(issue_id:int,session:AsyncSession) -> List[Logs]:
+async def get_logs_by_issue_id(issue_id:int,session:AsyncSession) -> List[dict]:
     """
     function to get all logs for an issue
+
+    Read-only list: selects the table directly and returns row mappings,
+    skipping ORM hydration per row.
     """
-    stmt = select(Logs).where(Logs.issue_id == issue_id)
-    logs = await session.execute(stmt)
-    logs = list(logs.scalars().all())
-    return logs
+    stmt = select(Logs.__table__).where(Logs.issue_id == issue_id)
+    result = await session.execute(stmt)
+    return list(result.mappings().all())
 
 
@@ -1,7 +1,7 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_, func, union, distinct
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.models.model import Project, ProjectMember, User
@@ -17,7 +17,8 @@ async def get_all_projects(user_id:int,session:AsyncSession) -> List[Project]:
     stmt = select(ProjectMember).filter(
         ProjectMember.user_id == user_id
     ).options(
-        joinedload(ProjectMember.project)
+        joinedload(ProjectMember.project).raiseload("*"),
+        raiseload("*")
     )
 
     result = await session.execute(stmt)
@@ -90,6 +91,18 @@ async def get_project_by_id(project_id:int,user_id:int,session:AsyncSession) ->
     project = result.scalar_one_or_none()
     return project
 
+async def get_project_team_members(project_id:int,session:AsyncSession) -> List[User]:
+    """
+    Get all users who are members of a project
+    """
+    stmt = (
+        select(User)
+        .join(ProjectMember, ProjectMember.user_id == User.id)
+        .where(ProjectMember.project_id == project_id)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
 async def create_project(session:AsyncSession,user_id:int,project_data:dict) -> Project:
     """
     Create a new project
@@ -1,6 +1,7 @@
 from app.models.model import User
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select,or_
+from sqlalchemy import select,or_,bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.core.security import hash_password,verify_password
 from app.core.enums import Role,UserStatus,TypeOfSignup
 from app.common.errors import NotFoundError
@@ -8,10 +9,16 @@ from typing import Optional,List
 
 
 
+# The hottest lookup statements are built once at import; reusing them
+# guarantees compiled-cache hits and skips per-call statement construction
+_GET_USER_BY_EMAIL = select(User).where(User.email == bindparam('email'))
+_GET_USER_BY_ID = select(User).where(User.id == bindparam('user_id'))
+_GET_USER_BY_GOOGLE_USER_ID = select(User).where(User.google_user_id == bindparam('google_user_id'))
+
+
 async def get_user_by_email(email:str,session:AsyncSession) -> Optional[User]:
 
-    stmt = select(User).where(User.email == email)
-    result = await session.execute(stmt)
+    result = await session.execute(_GET_USER_BY_EMAIL,{'email':email})
     return result.scalar_one_or_none()
 
 async def create_user_password(
@@ -19,25 +26,33 @@ async def create_user_password(
     email:str,
     password:str,
     session:AsyncSession
-)->User:
+)->Optional[User]:
 
     """
     create a user with email and password
+
+    The insert is atomic: ON CONFLICT(email) DO NOTHING closes the race
+    between a separate existence check and the insert, and RETURNING gives
+    the created row back in the same round trip.
+    Returns None when the email is already registered.
     """
 
     hashed_password = await hash_password(password)
 
-    user = User(
+    stmt = pg_insert(User).values(
         name = name.capitalize(),
         email = email,
         password = hashed_password,
         role = Role.ADMIN,
         status = UserStatus.ACTIVE,
         type_of_signup = TypeOfSignup.EMAIL
-    )
-    session.add(user)
+    ).on_conflict_do_nothing(
+        index_elements=[User.email]
+    ).returning(User)
+
+    result = await session.execute(stmt)
+    user = result.scalars().one_or_none()
     await session.commit()
-    await session.refresh(user)
     return user
 
 async def get_user_by_id(
@@ -47,8 +62,7 @@ async def get_user_by_id(
     """
     get user object by user id
     """
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
+    result = await session.execute(_GET_USER_BY_ID,{'user_id':user_id})
     return result.scalar_one_or_none()
 
 async def update_user_password(
@@ -101,28 +115,51 @@ async def get_user_by_google_user_id(google_user_id:str,session:AsyncSession) ->
     """
     Get user by google user id
     """
-    user = select(User).where(User.google_user_id == google_user_id)
-    result = await session.execute(user)
+    result = await session.execute(_GET_USER_BY_GOOGLE_USER_ID,{'google_user_id':google_user_id})
     return result.scalar_one_or_none()
 
+async def get_user_by_google_or_email(
+    google_user_id:str,
+    email:str,
+    session:AsyncSession
+) -> List[User]:
+    """
+    Get users matching either a google user id or an email in a single query
+    (at most two rows), so callers can branch without extra round trips
+    """
+    stmt = select(User).where(
+        or_(
+            User.google_user_id == google_user_id,
+            User.email == email
+        )
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
 async def create_user_google(
     google_user_id:str,
     name:str,
     email:str,
     session:AsyncSession
-) -> User:
+) -> Optional[User]:
     """
     Create user with google user id
+
+    Uses the same atomic ON CONFLICT(email) DO NOTHING insert as the
+    password signup; returns None if the email got registered concurrently.
     """
-    user = User(
+    stmt = pg_insert(User).values(
         google_user_id=google_user_id,
         name=name.capitalize(),
         email=email,
         role=Role.ADMIN,
         status=UserStatus.ACTIVE,
         type_of_signup=TypeOfSignup.GOOGLE
-    )
-    session.add(user)
+    ).on_conflict_do_nothing(
+        index_elements=[User.email]
+    ).returning(User)
+
+    result = await session.execute(stmt)
+    user = result.scalars().one_or_none()
     await session.commit()
-    await session.refresh(user)
     return user
\ No newline at end of file
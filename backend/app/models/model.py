@@ -2,7 +2,7 @@ from app.db.connection import Base
 from sqlalchemy import (
     Column, Integer, String, Boolean,
     DateTime, ForeignKey, func, Enum,
-    Date, Numeric, UniqueConstraint, Index
+    Date, Numeric, UniqueConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -36,6 +36,9 @@ class User(Base, TimestampMixin):
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
     google_user_id = Column(String, nullable=True)
+    # GitHub caps usernames at 39 chars; unique so webhook author lookups
+    # are a single index probe
+    github_username = Column(String(39), nullable=True, unique=True)
     type_of_signup =Column(Enum(TypeOfSignup,values_callcable= lambda enum:[e.value for e in enum]), default=TypeOfSignup.EMAIL, nullable=False)
     email = Column(String, nullable=False, unique=True)
     password = Column(String, nullable=True)
@@ -67,6 +70,11 @@ class Organization(Base, TimestampMixin):
     __tablename__ = "organization"
     __table_args__ = (
         Index('idx_org_status', 'status'),
+        # jsonb_path_ops: smaller/faster than the default opclass, supports
+        # the @> containment queries that hit the data column
+        Index('idx_org_data_gin', 'data',
+              postgresql_using='gin',
+              postgresql_ops={'data': 'jsonb_path_ops'}),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -82,8 +90,10 @@ class Organization(Base, TimestampMixin):
 
     data = Column(JSONB)
 
-    members = relationship("OrganizationMember", back_populates="organization", cascade="all, delete-orphan")
-    projects = relationship("Project", back_populates="organization", cascade="all, delete-orphan")
+    # passive_deletes: the DB's ON DELETE CASCADE removes children, so the
+    # ORM never loads them just to delete them row by row
+    members = relationship("OrganizationMember", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True)
+    projects = relationship("Project", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class OrganizationMember(Base, TimestampMixin):
@@ -96,7 +106,7 @@ class OrganizationMember(Base, TimestampMixin):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     user_id = Column(Integer, ForeignKey(User.id), nullable=False)
-    organization_id = Column(Integer, ForeignKey(Organization.id), nullable=False)
+    organization_id = Column(Integer, ForeignKey(Organization.id, ondelete='CASCADE'), nullable=False)
 
     organization = relationship("Organization", back_populates="members")
 
@@ -108,6 +118,12 @@ class Project(Base, TimestampMixin):
     __table_args__ = (
         Index('idx_project_status', 'status'),
         Index('idx_project_created_by', 'created_by'),
+        Index('idx_project_data_gin', 'data',
+              postgresql_using='gin',
+              postgresql_ops={'data': 'jsonb_path_ops'}),
+        # btree on the extracted text: the webhook path looks repos up by
+        # equality on data->>'github_repo' for every event
+        Index('idx_project_github_repo', text("(data->>'github_repo')")),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -126,13 +142,13 @@ class Project(Base, TimestampMixin):
     end_date = Column(Date)
     data = Column(JSONB)
 
-    organization_id = Column(Integer, ForeignKey(Organization.id), nullable=False)
+    organization_id = Column(Integer, ForeignKey(Organization.id, ondelete='CASCADE'), nullable=False)
 
     organization = relationship("Organization", back_populates="projects")
     created_by_user = relationship("User", foreign_keys=[created_by], lazy="selectin")
 
-    sprints = relationship("Sprint", back_populates="project", cascade="all, delete-orphan")
-    members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
+    sprints = relationship("Sprint", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
 
     
 
@@ -146,8 +162,8 @@ class ProjectMember(Base, TimestampMixin):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
-    organization_id = Column(Integer, ForeignKey(Organization.id), nullable=False)
-    project_id = Column(Integer, ForeignKey(Project.id), nullable=False)
+    organization_id = Column(Integer, ForeignKey(Organization.id, ondelete='CASCADE'), nullable=False)
+    project_id = Column(Integer, ForeignKey(Project.id, ondelete='CASCADE'), nullable=False)
     user_id = Column(Integer, ForeignKey(User.id), nullable=False)
 
     project = relationship("Project")
@@ -158,13 +174,18 @@ class ProjectMember(Base, TimestampMixin):
 
 class Sprint(Base, TimestampMixin):
     __tablename__ = "sprint"
+    __table_args__ = (
+        Index('idx_sprint_data_gin', 'data',
+              postgresql_using='gin',
+              postgresql_ops={'data': 'jsonb_path_ops'}),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     sprint_id = Column(String, nullable=False)
     name = Column(String, nullable=False)
 
-    project_id = Column(Integer, ForeignKey(Project.id), nullable=False)
+    project_id = Column(Integer, ForeignKey(Project.id, ondelete='CASCADE'), nullable=False)
 
     start_date = Column(Date)
     end_date = Column(Date)
@@ -177,7 +198,22 @@ class Sprint(Base, TimestampMixin):
     data = Column(JSONB)
 
     project = relationship("Project", back_populates="sprints")
-    issues = relationship("Issue", back_populates="sprint", cascade="all, delete-orphan")
+    issues = relationship("Issue", back_populates="sprint", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class GitHubPushCommit(Base):
+    __tablename__ = "github_push_commits"
+
+    # composite PK makes push replays idempotent: a redelivered push is
+    # one multi-row INSERT ... ON CONFLICT DO NOTHING
+    project_id = Column(Integer, ForeignKey(Project.id, ondelete='CASCADE'), primary_key=True)
+    commit_sha = Column(String(40), primary_key=True)
+
+    message = Column(String)
+    author_name = Column(String)
+    url = Column(String)
+
+    pushed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
 # ================= ISSUE =================
@@ -190,6 +226,13 @@ class Issue(Base, TimestampMixin):
         Index('idx_issue_sprint_id', 'sprint_id'),
         Index('idx_issue_assigned_to', 'assigned_to'),
         Index('idx_issue_assigned_by', 'assigned_by'),
+        # one row per GitHub issue/PR per project; partial so ordinary
+        # issues (NULL number) stay unconstrained, and the upsert the
+        # webhook handlers run conflicts against exactly this index
+        Index('uq_issue_project_github_number',
+              'project_id', 'github_issue_number', 'is_github_pr',
+              unique=True,
+              postgresql_where=text('github_issue_number IS NOT NULL')),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -206,7 +249,7 @@ class Issue(Base, TimestampMixin):
     priority = Column(Enum(Priority,name = 'priority', values_callable=lambda enum: [e.value for e in enum]),
                     default = Priority.MODERATE,
                     nullable = True)
-    sprint_id = Column(Integer, ForeignKey(Sprint.id),nullable=True)
+    sprint_id = Column(Integer, ForeignKey(Sprint.id, ondelete='CASCADE'),nullable=True)
     assigned_to = Column(Integer, ForeignKey(User.id),nullable=True)
     assigned_by = Column(Integer, ForeignKey(User.id))
 
@@ -215,11 +258,11 @@ class Issue(Base, TimestampMixin):
     assignee = relationship("User", foreign_keys=[assigned_to], lazy="selectin")
     reporter = relationship("User", foreign_keys=[assigned_by], lazy="selectin")
 
-    logs = relationship("Logs", back_populates="issue", cascade="all, delete-orphan")
+    logs = relationship("Logs", back_populates="issue", cascade="all, delete-orphan", passive_deletes=True)
     project_id = Column(Integer, ForeignKey(Project.id), nullable=False)
 
     project = relationship("Project", foreign_keys=[project_id], lazy="selectin")
-    parent_issue_id = Column(Integer, ForeignKey("issue.id"), nullable=True)
+    parent_issue_id = Column(Integer, ForeignKey("issue.id", ondelete='CASCADE'), nullable=True)
 
     parent_issue = relationship("Issue",
     foreign_keys=[parent_issue_id],
@@ -230,25 +273,30 @@ class Issue(Base, TimestampMixin):
     sub_issues = relationship(
         "Issue",
         back_populates="parent_issue",
-        cascade="all, delete"
+        cascade="all, delete",
+        passive_deletes=True
     )
     
     time_estimate = Column(Numeric, default=0, nullable=False)
+
+    # set only for issues mirrored from GitHub webhooks
+    github_issue_number = Column(Integer, nullable=True)
+    is_github_pr = Column(Boolean, default=False, server_default=text('false'), nullable=False)
     
-    attachments = relationship("Attachment", back_populates="issue", cascade="all, delete-orphan")
-    comments = relationship("Comment", back_populates="issue", cascade="all, delete-orphan")
+    attachments = relationship("Attachment", back_populates="issue", cascade="all, delete-orphan", passive_deletes=True)
+    comments = relationship("Comment", back_populates="issue", cascade="all, delete-orphan", passive_deletes=True)
 
 # ================= ATTACHMENTS =================
 
 class Attachment(Base, TimestampMixin):
     __tablename__ = "attachment"
     __table_args__ = (
-        Index('idx_attachment_issue_id', 'issue_id'),
+        Index('idx_attachment_issue_id_created_at', 'issue_id', text('created_at DESC')),
         Index('idx_attachment_user_id', 'uploaded_by'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    issue_id = Column(Integer, ForeignKey(Issue.id), nullable=False)
+    issue_id = Column(Integer, ForeignKey(Issue.id, ondelete='CASCADE'), nullable=False)
     file_name = Column(String, nullable=False)
     file_size = Column(Integer, nullable=False)  # Size in bytes
     file_type = Column(String, nullable=False)  # MIME type
@@ -264,12 +312,12 @@ class Attachment(Base, TimestampMixin):
 class Comment(Base, TimestampMixin):
     __tablename__ = "comment"
     __table_args__ = (
-        Index('idx_comment_issue_id', 'issue_id'),
+        Index('idx_comment_issue_id_created_at', 'issue_id', text('created_at DESC')),
         Index('idx_comment_user_id', 'user_id'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    issue_id = Column(Integer, ForeignKey(Issue.id), nullable=False)
+    issue_id = Column(Integer, ForeignKey(Issue.id, ondelete='CASCADE'), nullable=False)
     user_id = Column(Integer, ForeignKey(User.id), nullable=False)
     content = Column(String, nullable=False)
     edited = Column(Boolean, default=False, nullable=False)
@@ -284,7 +332,7 @@ class Logs(Base, TimestampMixin):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
-    issue_id = Column(Integer, ForeignKey(Issue.id), nullable=False)
+    issue_id = Column(Integer, ForeignKey(Issue.id, ondelete='CASCADE'), nullable=False)
     log_id = Column(String, nullable=False)
 
     date = Column(Date, nullable=False)
@@ -1,10 +1,12 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, validator, AliasPath, ConfigDict
 from typing import Optional
 from datetime import datetime
 
 
 class AttachmentResponse(BaseModel):
     """Response schema for attachment"""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
     id: int
     issue_id: int
     file_name: str
@@ -12,12 +14,15 @@ class AttachmentResponse(BaseModel):
     file_type: str
     file_url: str
     uploaded_by: int
-    uploader_name: Optional[str] = None
+    uploader_name: Optional[str] = Field(None, validation_alias=AliasPath('uploader', 'name'))
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+# Built at import so the core schema compiles once per process, and list
+# validation runs as a single pydantic-core call instead of one model
+# constructor per row
+attachment_list_adapter = TypeAdapter(list[AttachmentResponse])
 
 
 class AttachmentListResponse(BaseModel):
@@ -1,45 +1,44 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, AliasPath, ConfigDict
 from typing import Optional
 from datetime import datetime
 
 
 class CommentCreateRequest(BaseModel):
     """Request schema for creating a comment"""
+    # stripping happens in pydantic-core before the length checks, so
+    # whitespace-only content fails min_length with no Python validator
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     issue_id: int = Field(..., description="ID of the issue")
     content: str = Field(..., min_length=1, max_length=5000, description="Comment content")
 
-    @validator('content')
-    def validate_content(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Comment content cannot be empty')
-        return v.strip()
-
 
 class CommentUpdateRequest(BaseModel):
     """Request schema for updating a comment"""
-    content: str = Field(..., min_length=1, max_length=5000, description="Updated comment content")
+    model_config = ConfigDict(str_strip_whitespace=True)
 
-    @validator('content')
-    def validate_content(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Comment content cannot be empty')
-        return v.strip()
+    content: str = Field(..., min_length=1, max_length=5000, description="Updated comment content")
 
 
 class CommentResponse(BaseModel):
     """Response schema for comment"""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
     id: int
     issue_id: int
     user_id: int
-    user_name: Optional[str] = None
-    user_email: Optional[str] = None
+    user_name: Optional[str] = Field(None, validation_alias=AliasPath('user', 'name'))
+    user_email: Optional[str] = Field(None, validation_alias=AliasPath('user', 'email'))
     content: str
     edited: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+# Built at import so the core schema compiles once per process, and list
+# validation runs as a single pydantic-core call instead of one model
+# constructor per row
+comment_list_adapter = TypeAdapter(list[CommentResponse])
 
 
 class CommentListResponse(BaseModel):
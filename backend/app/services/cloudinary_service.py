@@ -55,6 +55,19 @@ class CloudinaryService:
             raise CloudinaryError(f"Error uploading file from bytes: {e}")
 
     
+    async def upload_stream(self,file_obj,public_id:str) -> str:
+        """Chunked upload straight from a file object (no full in-memory buffer)"""
+        try:
+            return await asyncio.to_thread(
+                cloudinary.uploader.upload_large,
+                file_obj,
+                public_id=public_id,
+                chunk_size=6000000,
+                resource_type="auto"
+            )
+        except CloudinaryError as e:
+            raise CloudinaryError(f"Error uploading file from stream: {e}")
+
     async def upload_unsigned(self, file_source, upload_preset: str, folder: str = None):
         """Unsigned upload (frontend → Cloudinary directly)"""
         try:
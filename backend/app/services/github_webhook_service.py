@@ -2,19 +2,54 @@
 GitHub Webhook Service
 Handles GitHub webhook events and integrates them with the project management system
 """
+import asyncio
+from collections import namedtuple
 from typing import Dict, Optional, List
+
+import orjson
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.models.model import Project, Issue, User
+from app.models.model import Project, Issue, User, GitHubPushCommit
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.db.crud.project_crud import get_project_by_id
-from app.db.crud.issue_crud import create_issue, get_issue_by_id, update_issue
+from app.db.crud.issue_crud import upsert_github_issue
 from sqlalchemy import select
 from app.models.model import Issue
 from app.core.enums import IssueStatus, IssueType, Priority
 from app.common.errors import NotFoundError
 from app.common.logging.logging_config import Logger
+from app.core.redis_config import redis_client
 from datetime import datetime
 
+# repo full name -> (project id, created_by) in Redis; the mapping
+# changes on the order of hours, the TTL bounds staleness. The key is
+# dropped eagerly when a repo is (re)linked.
+REPO_PROJECT_KEY = "gh:repo2proj:{repo}"
+REPO_PROJECT_TTL_SECONDS = 300
+
+# The slice of Project the webhook path actually reads
+ProjectRef = namedtuple("ProjectRef", ("id", "created_by"))
+
+
+# github_username -> user id (or None); the same author shows up across
+# many events, so both hits and misses are worth remembering briefly
+_github_user_cache = TTLCache(maxsize=1024, ttl=300)
+_CACHE_MISS = object()
+
+
+async def _find_user_id_on_own_session(github_username: str) -> Optional[int]:
+    """
+    Author lookup on a dedicated session so it can run concurrently with
+    the project lookup (one async session cannot overlap statements)
+    """
+    from app.db.connection import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        return await GitHubWebhookService.find_user_by_github_username(
+            session, github_username
+        )
+
 
 class GitHubWebhookService:
     """Service to handle GitHub webhook events"""
@@ -23,19 +58,43 @@ class GitHubWebhookService:
     async def find_project_by_repo(
         session: AsyncSession,
         repo_full_name: str
-    ) -> Optional[Project]:
+    ) -> Optional[ProjectRef]:
         """
-        Find a project by GitHub repository full name (owner/repo)
-        Searches in the project's data JSONB field
+        Find the project linked to a GitHub repository (owner/repo)
+
+        Read-through Redis cache over the data->>'github_repo' lookup;
+        the sync Redis client is used deliberately because this path
+        runs inside per-task Celery event loops that the shared async
+        pool must not bind to.
         """
+        key = REPO_PROJECT_KEY.format(repo=repo_full_name)
         try:
-            # Query projects where data->>'github_repo' matches the repo
-            stmt = select(Project).where(
+            cached = redis_client.get(key)
+            if cached:
+                return ProjectRef(*orjson.loads(cached))
+        except Exception as e:
+            Logger.error(f"Repo cache read failed for {repo_full_name}: {e}")
+
+        try:
+            # only the two columns the webhook path reads - never drag
+            # the whole row (including the data JSONB) across the wire
+            stmt = select(Project.id, Project.created_by).where(
                 Project.data['github_repo'].astext == repo_full_name
             )
             result = await session.execute(stmt)
-            project = result.scalar_one_or_none()
-            return project
+            row = result.first()
+            if row is None:
+                return None
+
+            ref = ProjectRef(row.id, row.created_by)
+            try:
+                redis_client.setex(
+                    key, REPO_PROJECT_TTL_SECONDS,
+                    orjson.dumps(list(ref))
+                )
+            except Exception as e:
+                Logger.error(f"Repo cache write failed for {repo_full_name}: {e}")
+            return ref
         except Exception as e:
             Logger.error(f"Error finding project by repo {repo_full_name}: {e}")
             return None
@@ -44,20 +103,25 @@ class GitHubWebhookService:
     async def find_user_by_github_username(
         session: AsyncSession,
         github_username: str
-    ) -> Optional[User]:
+    ) -> Optional[int]:
         """
-        Find a user by GitHub username
-        Searches in user data or email
+        Find a user's id by their GitHub username
+
+        Exact lookup on the unique user.github_username column; results
+        (including misses) are cached briefly in-process.
         """
+        cached = _github_user_cache.get(github_username, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
-            # Try to find by email (GitHub username + @github.com or similar)
-            # Or search in user data JSONB if it exists
-            stmt = select(User).where(
-                User.email.ilike(f"%{github_username}%")
+            stmt = select(User.id).where(
+                User.github_username == github_username
             )
             result = await session.execute(stmt)
-            user = result.scalar_one_or_none()
-            return user
+            user_id = result.scalar_one_or_none()
+            _github_user_cache[github_username] = user_id
+            return user_id
         except Exception as e:
             Logger.error(f"Error finding user by GitHub username {github_username}: {e}")
             return None
@@ -68,24 +132,21 @@ class GitHubWebhookService:
         project_id: int,
         github_issue_number: int,
         is_pr: bool = False
-    ) -> Optional[Issue]:
+    ) -> Optional[int]:
         """
-        Find an issue by GitHub issue number or PR number
-        Searches for issues with name starting with "GitHub Issue #{number}:" or "PR #{number}:"
+        Find an issue's id by its GitHub issue or PR number
+
+        Equality lookup on the (project_id, github_issue_number,
+        is_github_pr) index; only the id comes back, not a full row.
         """
         try:
-            if is_pr:
-                search_pattern = f"PR #{github_issue_number}:"
-            else:
-                search_pattern = f"GitHub Issue #{github_issue_number}:"
-            
-            stmt = select(Issue).where(
+            stmt = select(Issue.id).where(
                 Issue.project_id == project_id,
-                Issue.name.like(f"{search_pattern}%")
-            )
+                Issue.github_issue_number == github_issue_number,
+                Issue.is_github_pr == is_pr
+            ).limit(1)
             result = await session.execute(stmt)
-            issue = result.scalar_one_or_none()
-            return issue
+            return result.scalar_one_or_none()
         except Exception as e:
             Logger.error(f"Error finding issue by GitHub number {github_issue_number}: {e}")
             return None
@@ -123,9 +184,27 @@ class GitHubWebhookService:
                 f"Push event received for repo {repo_full_name}, "
                 f"project {project.id}, {len(commits)} commits"
             )
-            
-            # You could create a log entry or update project activity here
-            # For now, just return success
+
+            # One multi-row insert for the whole push; the composite PK
+            # makes redelivered pushes a no-op instead of an error
+            rows = [
+                {
+                    'project_id': project.id,
+                    'commit_sha': commit['id'],
+                    'message': commit.get('message'),
+                    'author_name': commit.get('author', {}).get('name'),
+                    'url': commit.get('url'),
+                }
+                for commit in commits if commit.get('id')
+            ]
+            if rows:
+                await session.execute(
+                    pg_insert(GitHubPushCommit).values(rows).on_conflict_do_nothing(
+                        index_elements=['project_id', 'commit_sha']
+                    )
+                )
+                await session.commit()
+
             return {
                 "status": "success",
                 "project_id": project.id,
@@ -153,15 +232,7 @@ class GitHubWebhookService:
             
             if not repo_full_name or not pr:
                 return {"status": "skipped", "reason": "Invalid PR data"}
-            
-            # Find project
-            project = await GitHubWebhookService.find_project_by_repo(
-                session, repo_full_name
-            )
-            
-            if not project:
-                return {"status": "skipped", "reason": "No linked project found"}
-            
+
             pr_number = pr.get('number')
             pr_title = pr.get('title', 'Untitled PR')
             pr_body = pr.get('body', '')
@@ -170,6 +241,15 @@ class GitHubWebhookService:
             pr_merged = pr.get('merged', False)
             pr_user = pr.get('user', {})
             pr_author = pr_user.get('login', 'Unknown')
+
+            # project and author lookups are independent; overlap them
+            project, user_id = await asyncio.gather(
+                GitHubWebhookService.find_project_by_repo(session, repo_full_name),
+                _find_user_id_on_own_session(pr_author)
+            )
+
+            if not project:
+                return {"status": "skipped", "reason": "No linked project found"}
             
             # Find or create issue for this PR
             # Use PR number in issue name to link them
@@ -193,58 +273,30 @@ class GitHubWebhookService:
                 'description': issue_description,
                 'project_id': project.id,
                 'type': IssueType.TASK.value,
-                'status': issue_status.value if hasattr(issue_status, 'value') else issue_status,
+                'status': issue_status.value,
                 'priority': Priority.MODERATE.value,
                 'story_point': 0,
                 'time_estimate': 0,  # Required field, default to 0
+                'github_issue_number': pr_number,
+                'is_github_pr': True,
+                'assigned_by': project.created_by or 1,  # Use project creator or default
             }
-            
-            # Try to find user by GitHub username
-            user = await GitHubWebhookService.find_user_by_github_username(
-                session, pr_author
-            )
-            if user:
-                issue_data['assigned_to'] = user.id
-            
-            # Check if issue already exists (for updates)
-            existing_issue = await GitHubWebhookService.find_issue_by_github_number(
-                session, project.id, pr_number, is_pr=True
+
+            if user_id:
+                issue_data['assigned_to'] = user_id
+
+            # one upsert keyed on (project_id, github_issue_number,
+            # is_github_pr) replaces the old find-then-create/update
+            issue_id = await upsert_github_issue(session, issue_data)
+            Logger.info(
+                f"Upserted issue {issue_id} for PR #{pr_number} "
+                f"in project {project.id}, action: {action}"
             )
-            
-            if existing_issue:
-                # Update existing issue
-                updated_issue = await update_issue(
-                    session=session,
-                    issue_id=existing_issue.id,
-                    payload={
-                        'name': issue_data['name'],
-                        'description': issue_data['description'],
-                        'status': issue_data['status'],
-                        'type': issue_data['type'],
-                        'priority': issue_data['priority'],
-                    }
-                )
-                Logger.info(
-                    f"Updated issue {updated_issue.id} for PR #{pr_number} "
-                    f"in project {project.id}, action: {action}"
-                )
-                issue = updated_issue
-            else:
-                # Create new issue
-                issue = await create_issue(
-                    session=session,
-                    user_id=project.created_by or 1,  # Use project creator or default
-                    payload=issue_data
-                )
-                Logger.info(
-                    f"Created issue {issue.id} for PR #{pr_number} "
-                    f"in project {project.id}, action: {action}"
-                )
-            
+
             return {
                 "status": "success",
                 "project_id": project.id,
-                "issue_id": issue.id,
+                "issue_id": issue_id,
                 "pr_number": pr_number,
                 "action": action
             }
@@ -269,22 +321,23 @@ class GitHubWebhookService:
             
             if not repo_full_name or not github_issue:
                 return {"status": "skipped", "reason": "Invalid issue data"}
-            
-            # Find project
-            project = await GitHubWebhookService.find_project_by_repo(
-                session, repo_full_name
+
+            issue_author = github_issue.get('user', {}).get('login', 'Unknown')
+
+            # project and author lookups are independent; overlap them
+            project, user_id = await asyncio.gather(
+                GitHubWebhookService.find_project_by_repo(session, repo_full_name),
+                _find_user_id_on_own_session(issue_author)
             )
-            
+
             if not project:
                 return {"status": "skipped", "reason": "No linked project found"}
-            
+
             issue_number = github_issue.get('number')
             issue_title = github_issue.get('title', 'Untitled')
             issue_body = github_issue.get('body', '')
             issue_url = github_issue.get('html_url', '')
             issue_state = github_issue.get('state')  # open, closed
-            issue_user = github_issue.get('user', {})
-            issue_author = issue_user.get('login', 'Unknown')
             labels = github_issue.get('labels', [])
             
             # Determine issue status
@@ -293,93 +346,63 @@ class GitHubWebhookService:
             else:
                 issue_status = IssueStatus.TODO
             
-            # Determine issue type from labels
+            # Single pass over labels: type, priority and the joined name
+            # list all come out of one loop, each name lowercased once
             issue_type = IssueType.TASK
-            for label in labels:
-                label_name = label.get('name', '').lower()
-                if 'bug' in label_name:
-                    issue_type = IssueType.BUG
-                    break
-                elif 'feature' in label_name:
-                    issue_type = IssueType.FEATURE
-                    break
-            
-            # Determine priority from labels
             priority = Priority.MODERATE
+            label_names = []
             for label in labels:
-                label_name = label.get('name', '').lower()
-                if 'critical' in label_name or 'high' in label_name:
-                    priority = Priority.HIGH
-                    break
-                elif 'low' in label_name:
-                    priority = Priority.LOW
-                    break
-            
+                name = label.get('name', '')
+                label_names.append(name)
+                lowered = name.lower()
+                if issue_type is IssueType.TASK:
+                    if 'bug' in lowered:
+                        issue_type = IssueType.BUG
+                    elif 'feature' in lowered:
+                        issue_type = IssueType.FEATURE
+                if priority is Priority.MODERATE:
+                    if 'critical' in lowered or 'high' in lowered:
+                        priority = Priority.HIGH
+                    elif 'low' in lowered:
+                        priority = Priority.LOW
+
             issue_name = f"GitHub Issue #{issue_number}: {issue_title}"
             issue_body_text = issue_body if issue_body else "No description provided"
             issue_description = (
                 f"GitHub Issue\n\n{issue_body_text}\n\n"
                 f"Issue URL: {issue_url}\n"
-                f"Labels: {', '.join([l.get('name', '') for l in labels]) if labels else 'None'}"
+                f"Labels: {', '.join(label_names) if label_names else 'None'}"
             )
             
             issue_data = {
                 'name': issue_name,
                 'description': issue_description,
                 'project_id': project.id,
-                'type': issue_type.value if hasattr(issue_type, 'value') else issue_type,
-                'status': issue_status.value if hasattr(issue_status, 'value') else issue_status,
-                'priority': priority.value if hasattr(priority, 'value') else priority,
+                'type': issue_type.value,
+                'status': issue_status.value,
+                'priority': priority.value,
                 'story_point': 0,
                 'time_estimate': 0,  # Required field, default to 0
+                'github_issue_number': issue_number,
+                'is_github_pr': False,
+                'assigned_by': project.created_by or 1,
             }
-            
-            # Try to find user by GitHub username
-            user = await GitHubWebhookService.find_user_by_github_username(
-                session, issue_author
-            )
-            if user:
-                issue_data['assigned_to'] = user.id
-            
-            # Check if issue already exists (for updates)
-            existing_issue = await GitHubWebhookService.find_issue_by_github_number(
-                session, project.id, issue_number
+
+            if user_id:
+                issue_data['assigned_to'] = user_id
+
+            # one upsert keyed on (project_id, github_issue_number,
+            # is_github_pr) replaces the old find-then-create/update
+            issue_id = await upsert_github_issue(session, issue_data)
+            Logger.info(
+                f"Upserted issue {issue_id} from GitHub issue #{issue_number} "
+                f"in project {project.id}, action: {action}"
             )
-            
-            if existing_issue:
-                # Update existing issue
-                updated_issue = await update_issue(
-                    session=session,
-                    issue_id=existing_issue.id,
-                    payload={
-                        'name': issue_data['name'],
-                        'description': issue_data['description'],
-                        'status': issue_data['status'],
-                        'type': issue_data['type'],
-                        'priority': issue_data['priority'],
-                    }
-                )
-                Logger.info(
-                    f"Updated issue {updated_issue.id} from GitHub issue #{issue_number} "
-                    f"in project {project.id}, action: {action}"
-                )
-                issue = updated_issue
-            else:
-                # Create new issue
-                issue = await create_issue(
-                    session=session,
-                    user_id=project.created_by or 1,
-                    payload=issue_data
-                )
-                Logger.info(
-                    f"Created issue {issue.id} from GitHub issue #{issue_number} "
-                    f"in project {project.id}, action: {action}"
-                )
-            
+
             return {
                 "status": "success",
                 "project_id": project.id,
-                "issue_id": issue.id,
+                "issue_id": issue_id,
                 "github_issue_number": issue_number,
                 "action": action
             }
@@ -434,14 +457,7 @@ class GitHubWebhookService:
         """
         Process GitHub webhook event based on event type
         """
-        handlers = {
-            'push': GitHubWebhookService.handle_push_event,
-            'pull_request': GitHubWebhookService.handle_pull_request_event,
-            'issues': GitHubWebhookService.handle_issues_event,
-            'release': GitHubWebhookService.handle_release_event,
-        }
-        
-        handler = handlers.get(event_type)
+        handler = _HANDLERS.get(event_type)
         if not handler:
             Logger.info(f"Unhandled event type: {event_type}")
             return {
@@ -455,3 +471,12 @@ class GitHubWebhookService:
         except Exception as e:
             Logger.error(f"Error processing {event_type} event: {e}")
             return {"status": "error", "message": str(e)}
+
+# event type -> handler, resolved once at import instead of rebuilding
+# the table (and re-binding four methods) on every webhook
+_HANDLERS = {
+    'push': GitHubWebhookService.handle_push_event,
+    'pull_request': GitHubWebhookService.handle_pull_request_event,
+    'issues': GitHubWebhookService.handle_issues_event,
+    'release': GitHubWebhookService.handle_release_event,
+}
@@ -6,56 +6,69 @@ from fastapi import status
 
 class RedisPublisher:
     @staticmethod
-    async def publish_issue_update(project_id: int, issue_data: dict):
-        """Publish issue update event to Redis"""
+    async def _publish(channel: str, message: dict):
+        """Publish one message; Redis failures are logged, never raised"""
         try:
-            channel = f"project:{project_id}:updates"
-            message = {
-                "type": "issue_updated",
-                "data": issue_data
-            }
             result = await async_redis_client.publish(channel, json.dumps(message))
-            Logger.info(f"Published issue update to Redis channel: {channel}, subscribers: {result}")
-            
+            Logger.info(f"Published {message['type']} to Redis channel: {channel}, subscribers: {result}")
         except Exception as e:
             import traceback
-            Logger.error(f"Error publishing issue update to Redis: {e}")
+            Logger.error(f"Error publishing {message['type']} to Redis: {e}")
             Logger.error(f"Redis publish traceback: {traceback.format_exc()}")
             # Don't raise - allow the API to succeed even if Redis fails
-            # This prevents Redis issues from breaking the update API
-    
+            # This prevents Redis issues from breaking the mutation APIs
+
     @staticmethod
-    async def publish_issue_created(project_id: int, issue_data: dict):
-        """Publish issue creation event to Redis"""
+    async def publish_batch(events: list):
+        """
+        Publish several (channel, message_dict) events in one pipelined
+        round trip instead of one RTT per publish
+        """
+        if not events:
+            return
         try:
-            channel = f"project:{project_id}:updates"
-            message = {
-                "type": "issue_created",
-                "data": issue_data
-            }
-            result = await async_redis_client.publish(channel, json.dumps(message))
-            Logger.info(f"Published issue creation to Redis channel: {channel}, subscribers: {result}")
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                for channel, message in events:
+                    pipe.publish(channel, json.dumps(message))
+                results = await pipe.execute()
+            Logger.info(f"Published {len(events)} events to Redis in one pipeline, subscribers: {results}")
         except Exception as e:
             import traceback
-            Logger.error(f"Error publishing create issue to Redis: {e}")
+            Logger.error(f"Error publishing batch to Redis: {e}")
             Logger.error(f"Redis publish traceback: {traceback.format_exc()}")
             # Don't raise - allow the API to succeed even if Redis fails
-    
+
+    @staticmethod
+    async def publish_issue_update(project_id: int, issue_data: dict):
+        """Publish issue update event to Redis"""
+        await RedisPublisher._publish(
+            f"project:{project_id}:updates",
+            {
+                "type": "issue_updated",
+                "data": issue_data
+            }
+        )
+
+    @staticmethod
+    async def publish_issue_created(project_id: int, issue_data: dict):
+        """Publish issue creation event to Redis"""
+        await RedisPublisher._publish(
+            f"project:{project_id}:updates",
+            {
+                "type": "issue_created",
+                "data": issue_data
+            }
+        )
+
     @staticmethod
     async def publish_issue_deleted(project_id: int, issue_id: int):
         """Publish issue deletion event to Redis"""
-        try:
-            channel = f"project:{project_id}:updates"
-            message = {
+        await RedisPublisher._publish(
+            f"project:{project_id}:updates",
+            {
                 "type": "issue_deleted",
                 "data": {"issue_id": issue_id}
             }
-            result = await async_redis_client.publish(channel, json.dumps(message))
-            Logger.info(f"Published issue deletion to Redis channel: {channel}, subscribers: {result}")
-        except Exception as e:
-            import traceback
-            Logger.error(f"Error publishing issue deletion to Redis: {e}")
-            Logger.error(f"Redis publish traceback: {traceback.format_exc()}")
-            # Don't raise - allow the API to succeed even if Redis fails
+        )
 
-redis_publisher = RedisPublisher()
\ No newline at end of file
+redis_publisher = RedisPublisher()
@@ -7,6 +7,51 @@ from app.services.slack_service import SlackService
 from app.common.errors import ClientErrors
 from app.common.logging.logging_config import Logger
 
+# Lookup tables shared by every formatter; built once at import instead
+# of being re-allocated per notification
+_STATUS_EMOJI: Dict[str, str] = {
+    "todo": "📋",
+    "in_progress": "🔄",
+    "in_review": "👀",
+    "qa": "🧪",
+    "completed": "✅",
+    "blocked": "🚫",
+}
+_DEFAULT_STATUS_EMOJI = "📋"
+
+_PRIORITY_COLORS: Dict[str, str] = {
+    "low": "#36a64f",
+    "moderate": "#ffa500",
+    "high": "#ff0000",
+}
+_DEFAULT_PRIORITY_COLOR = "#ffa500"
+
+
+def _header(text: str) -> Dict[str, Any]:
+    return {"type": "header", "text": {"type": "plain_text", "text": text}}
+
+
+def _mrkdwn(text: str) -> Dict[str, str]:
+    return {"type": "mrkdwn", "text": text}
+
+
+# Header blocks are constant per (event, emoji), so they are built once
+# here and shared across messages. Safe because blocks only ever flow
+# into orjson.dumps and are never mutated downstream.
+_EMOJIS = frozenset(_STATUS_EMOJI.values()) | {_DEFAULT_STATUS_EMOJI}
+_CREATED_HEADERS = {e: _header(f"{e} New Issue Created") for e in _EMOJIS}
+_UPDATED_HEADERS = {e: _header(f"{e} Issue Updated") for e in _EMOJIS}
+_STATUS_CHANGED_HEADERS = {e: _header(f"{e} Status Changed") for e in _EMOJIS}
+_ASSIGNED_HEADER = _header("👤 Issue Assigned")
+_SPRINT_HEADERS = {
+    "started": _header("🚀 Sprint Started"),
+    "ended": _header("🏁 Sprint Ended"),
+}
+_MILESTONE_HEADER = _header("🎯 Project Milestone")
+
+# Slack caps messages at 50 blocks; leave headroom under the header
+_BATCH_EVENT_CAP = 20
+
 
 class SlackNotificationService:
     """Service for formatting and sending Slack notifications"""
@@ -18,54 +63,20 @@ class SlackNotificationService:
         Args:
             issue_data: Dictionary containing issue fields directly (name, status, priority, type)
         """
-        status_emoji = {
-            "todo": "📋",
-            "in_progress": "🔄",
-            "in_review": "👀",
-            "qa": "🧪",
-            "completed": "✅",
-            "blocked": "🚫",
-        }
-
-        priority_colors = {
-            "low": "#36a64f",
-            "moderate": "#ffa500",
-            "high": "#ff0000",
-        }
-        
         # issue_data should contain fields directly, not wrapped in "issue" key
         status = issue_data.get("status", "todo").lower()
         priority = issue_data.get("priority", "moderate").lower()
-        emoji = status_emoji.get(status, "📋")
-        color = priority_colors.get(priority, "#ffa500")
+        emoji = _STATUS_EMOJI.get(status, _DEFAULT_STATUS_EMOJI)
 
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} New Issue Created"
-                }
-            },
+            _CREATED_HEADERS[emoji],
             {
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Issue:*\n{issue_data.get('name', 'Untitled')}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Status:*\n{status.title()}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Priority:*\n{priority.title()}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Type:*\n{issue_data.get('type', 'Task').title()}"
-                    }
+                    _mrkdwn(f"*Issue:*\n{issue_data.get('name', 'Untitled')}"),
+                    _mrkdwn(f"*Status:*\n{status.title()}"),
+                    _mrkdwn(f"*Priority:*\n{priority.title()}"),
+                    _mrkdwn(f"*Type:*\n{issue_data.get('type', 'Task').title()}")
                 ]
             }
         ]
@@ -78,53 +89,24 @@ class SlackNotificationService:
             issue_data: Dictionary containing issue fields directly (name, status, priority, type)
             changes: Dictionary containing change information
         """
-        status_emoji = {
-            "todo": "📋",
-            "in_progress": "🔄",
-            "in_review": "👀",
-            "qa": "🧪",
-            "completed": "✅",
-            "blocked": "🚫",
-        }
-
         # issue_data should contain fields directly, not wrapped in "issue" key
         status = issue_data.get("status", "todo").lower()
-        emoji = status_emoji.get(status, "📋")
+        emoji = _STATUS_EMOJI.get(status, _DEFAULT_STATUS_EMOJI)
 
-        fields = [
-            {
-                "type": "mrkdwn",
-                "text": f"*Issue:*\n{issue_data.get('name', 'Untitled')}"
-            }
-        ]
+        fields = [_mrkdwn(f"*Issue:*\n{issue_data.get('name', 'Untitled')}")]
 
         # Add changed fields
         if "status" in changes:
-            fields.append({
-                "type": "mrkdwn",
-                "text": f"*Status:*\n{changes['status']['old']} → {changes['status']['new']}"
-            })
+            fields.append(_mrkdwn(f"*Status:*\n{changes['status']['old']} → {changes['status']['new']}"))
 
         if "priority" in changes:
-            fields.append({
-                "type": "mrkdwn",
-                "text": f"*Priority:*\n{changes['priority']['old']} → {changes['priority']['new']}"
-            })
+            fields.append(_mrkdwn(f"*Priority:*\n{changes['priority']['old']} → {changes['priority']['new']}"))
 
         if "assigned_to" in changes:
-            fields.append({
-                "type": "mrkdwn",
-                "text": f"*Assigned To:*\n{changes['assigned_to']['old']} → {changes['assigned_to']['new']}"
-            })
+            fields.append(_mrkdwn(f"*Assigned To:*\n{changes['assigned_to']['old']} → {changes['assigned_to']['new']}"))
 
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} Issue Updated"
-                }
-            },
+            _UPDATED_HEADERS[emoji],
             {
                 "type": "section",
                 "fields": fields
@@ -141,24 +123,12 @@ class SlackNotificationService:
         """
         # issue_data should contain fields directly, not wrapped in "issue" key
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "👤 Issue Assigned"
-                }
-            },
+            _ASSIGNED_HEADER,
             {
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Issue:*\n{issue_data.get('name', 'Untitled')}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Assigned To:*\n{assignee_name}"
-                    }
+                    _mrkdwn(f"*Issue:*\n{issue_data.get('name', 'Untitled')}"),
+                    _mrkdwn(f"*Assigned To:*\n{assignee_name}")
                 ]
             }
         ]
@@ -172,37 +142,16 @@ class SlackNotificationService:
             old_status: Previous status
             new_status: New status
         """
-        status_emoji = {
-            "todo": "📋",
-            "in_progress": "🔄",
-            "in_review": "👀",
-            "qa": "🧪",
-            "completed": "✅",
-            "blocked": "🚫",
-        }
-
-        new_emoji = status_emoji.get(new_status.lower(), "📋")
+        new_emoji = _STATUS_EMOJI.get(new_status.lower(), _DEFAULT_STATUS_EMOJI)
 
         # issue_data should contain fields directly, not wrapped in "issue" key
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{new_emoji} Status Changed"
-                }
-            },
+            _STATUS_CHANGED_HEADERS[new_emoji],
             {
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Issue:*\n{issue_data.get('name', 'Untitled')}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Status:*\n{old_status.title()} → {new_status.title()}"
-                    }
+                    _mrkdwn(f"*Issue:*\n{issue_data.get('name', 'Untitled')}"),
+                    _mrkdwn(f"*Status:*\n{old_status.title()} → {new_status.title()}")
                 ]
             }
         ]
@@ -210,28 +159,13 @@ class SlackNotificationService:
     @staticmethod
     def _format_sprint_message(sprint_data: Dict[str, Any], event_type: str) -> list:
         """Format message for sprint events"""
-        emoji = "🚀" if event_type == "started" else "🏁"
-        title = "Sprint Started" if event_type == "started" else "Sprint Ended"
-
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} {title}"
-                }
-            },
+            _SPRINT_HEADERS.get(event_type, _SPRINT_HEADERS["ended"]),
             {
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Sprint:*\n{sprint_data.get('name', 'Untitled')}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Duration:*\n{sprint_data.get('start_date', '')} - {sprint_data.get('end_date', '')}"
-                    }
+                    _mrkdwn(f"*Sprint:*\n{sprint_data.get('name', 'Untitled')}"),
+                    _mrkdwn(f"*Duration:*\n{sprint_data.get('start_date', '')} - {sprint_data.get('end_date', '')}")
                 ]
             }
         ]
@@ -240,52 +174,19 @@ class SlackNotificationService:
     def _format_milestone_message(milestone_data: Dict[str, Any]) -> list:
         """Format message for project milestone event"""
         return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🎯 Project Milestone"
-                }
-            },
+            _MILESTONE_HEADER,
             {
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Milestone:*\n{milestone_data.get('name', 'Untitled')}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Project:*\n{milestone_data.get('project_name', 'Unknown')}"
-                    }
+                    _mrkdwn(f"*Milestone:*\n{milestone_data.get('name', 'Untitled')}"),
+                    _mrkdwn(f"*Project:*\n{milestone_data.get('project_name', 'Unknown')}")
                 ]
             }
         ]
 
     @staticmethod
-    async def send_notification(
-        webhook_url: str,
-        notification_type: str,
-        data: Dict[str, Any],
-        channel: Optional[str] = None
-    ) -> bool:
-        """
-        Send a formatted notification to Slack
-        
-        Args:
-            webhook_url: Slack webhook URL
-            notification_type: Type of notification (issue_created, issue_updated, etc.)
-            data: Notification data
-            channel: Optional channel override
-            
-        Returns:
-            bool: True if notification sent successfully
-        """
-        if not webhook_url:
-            raise ClientErrors(message="Slack webhook URL is required")
-
-        blocks = None
-
+    def _format_event(notification_type: str, data: Dict[str, Any]) -> list:
+        """Dispatch one event to its formatter; shared with batch sends"""
         if notification_type == "issue_created":
             # Extract issue data from the notification data structure
             issue_data = data.get("issue", data)  # Handle both wrapped and direct formats
@@ -313,7 +214,7 @@ class SlackNotificationService:
         elif notification_type == "project_milestone":
             blocks = SlackNotificationService._format_milestone_message(data)
         else:
-            Logger.warning(f"Unknown notification type: {notification_type}")
+            Logger.warning("Unknown notification type: %s", notification_type)
             blocks = [
                 {
                     "type": "section",
@@ -324,6 +225,48 @@ class SlackNotificationService:
                 }
             ]
 
+        return blocks
+
+    @staticmethod
+    def _format_batch_message(events: list) -> list:
+        """Combine coalesced events into one message, one section each"""
+        blocks = [_header(f"🗂 {len(events)} project updates")]
+        for event in events[:_BATCH_EVENT_CAP]:
+            event_blocks = SlackNotificationService._format_event(
+                event.get("notification_type", ""),
+                event.get("data", {})
+            )
+            # drop each event's header block, keep its section(s)
+            blocks.extend(event_blocks[1:] or event_blocks)
+        return blocks
+
+    @staticmethod
+    async def send_notification(
+        webhook_url: str,
+        notification_type: str,
+        data: Dict[str, Any],
+        channel: Optional[str] = None
+    ) -> bool:
+        """
+        Send a formatted notification to Slack
+
+        Args:
+            webhook_url: Slack webhook URL
+            notification_type: Type of notification (issue_created, issue_updated, etc.)
+            data: Notification data
+            channel: Optional channel override
+
+        Returns:
+            bool: True if notification sent successfully
+        """
+        if not webhook_url:
+            raise ClientErrors(message="Slack webhook URL is required")
+
+        if notification_type == "issue_batch":
+            blocks = SlackNotificationService._format_batch_message(data.get("events", []))
+        else:
+            blocks = SlackNotificationService._format_event(notification_type, data)
+
         return await SlackService.send_message(
             webhook_url=webhook_url,
             blocks=blocks,
@@ -2,11 +2,94 @@
 Slack Service
 Handles communication with Slack API via webhooks
 """
+import asyncio
+import time
+from weakref import WeakKeyDictionary
+
 import httpx
+import orjson
 from typing import Dict, Optional, Any
 from app.common.errors import ClientErrors, ServerErrors
 from app.common.logging.logging_config import Logger
 
+_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# One pooled client per running event loop: the API process reuses a
+# single warm TLS+TCP connection pool across requests, while Celery
+# workers (a fresh loop per asyncio.run) each get their own. Keyed
+# weakly so entries vanish with their loop.
+_clients: "WeakKeyDictionary" = WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(timeout=10.0, limits=_CLIENT_LIMITS)
+        _clients[loop] = client
+    return client
+
+
+# Webhook URLs that already passed format validation; bounded so a
+# flood of bad-but-wellformed URLs cannot grow it without limit
+_validated_urls: set = set()
+_VALIDATED_URLS_CAP = 1024
+
+# Per-webhook circuit breaker: consecutive 429/5xx responses open the
+# circuit with multiplicative backoff (Retry-After wins when Slack
+# sends it), so an outage sheds load instead of stacking requests.
+# Raising while open feeds straight into the delivery task's Celery
+# retry schedule, which is what bounds in-flight concurrency here.
+_CIRCUIT_BASE_BACKOFF = 2.0
+_CIRCUIT_MAX_BACKOFF = 300.0
+
+# webhook_url -> [consecutive_failures, open_until_monotonic]
+_circuits: Dict[str, list] = {}
+
+
+def _circuit_check(webhook_url: str) -> None:
+    circuit = _circuits.get(webhook_url)
+    if circuit and time.monotonic() < circuit[1]:
+        raise ServerErrors(
+            message="Slack webhook circuit open after repeated failures, retry later",
+            response_code=503
+        )
+
+
+def _circuit_record_failure(webhook_url: str, retry_after: Optional[str]) -> None:
+    circuit = _circuits.setdefault(webhook_url, [0, 0.0])
+    circuit[0] += 1
+    if retry_after and retry_after.isdigit():
+        backoff = float(retry_after)
+    else:
+        backoff = min(_CIRCUIT_BASE_BACKOFF * (2 ** (circuit[0] - 1)), _CIRCUIT_MAX_BACKOFF)
+    circuit[1] = time.monotonic() + backoff
+
+
+def _circuit_record_success(webhook_url: str) -> None:
+    _circuits.pop(webhook_url, None)
+
+
+# Immutable test payload; rebuilt-per-call literals just churn the
+# allocator. Never mutated, only serialized.
+_TEST_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "✅ *Test Message from Zyro*\n\nThis is a test notification to verify your Slack integration is working correctly."
+        }
+    }
+]
+
+
+async def close_slack_client() -> None:
+    """Close the current loop's pooled client (app shutdown hook)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
 
 class SlackService:
     """Service for sending messages to Slack via webhooks"""
@@ -38,19 +121,25 @@ class SlackService:
             ClientErrors: If webhook URL is invalid or request fails
             ServerErrors: If there's a server error
         """
-        if not webhook_url or not webhook_url.strip():
-            raise ClientErrors(message="Slack webhook URL is required")
+        # Validation is a pure prefix check, so a known-good URL skips it
+        if webhook_url not in _validated_urls:
+            if not webhook_url or not webhook_url.strip():
+                raise ClientErrors(message="Slack webhook URL is required")
+
+            # Validate webhook URL format
+            if not webhook_url.startswith("https://hooks.slack.com/services/"):
+                raise ClientErrors(message="Invalid Slack webhook URL format")
 
-        # Validate webhook URL format
-        if not webhook_url.startswith("https://hooks.slack.com/services/"):
-            raise ClientErrors(message="Invalid Slack webhook URL format")
+            if len(_validated_urls) >= _VALIDATED_URLS_CAP:
+                _validated_urls.clear()
+            _validated_urls.add(webhook_url)
 
-        payload: Dict[str, Any] = {}
+        _circuit_check(webhook_url)
 
         if blocks:
-            payload["blocks"] = blocks
+            payload: Dict[str, Any] = {"blocks": blocks}
         elif text:
-            payload["text"] = text
+            payload = {"text": text}
         else:
             raise ClientErrors(message="Either 'text' or 'blocks' must be provided")
 
@@ -61,29 +150,39 @@ class SlackService:
         if icon_emoji:
             payload["icon_emoji"] = icon_emoji
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(webhook_url, json=payload)
-
-            if response.status_code == 200:
-                Logger.info(f"Slack message sent successfully to {webhook_url}")
-                return True
-            elif response.status_code == 404:
-                raise ClientErrors(
-                    message="Slack webhook URL not found. Please verify the webhook URL is correct.",
-                    response_code=404
-                )
-            elif response.status_code == 400:
-                error_text = response.text
-                raise ClientErrors(
-                    message=f"Invalid Slack webhook request: {error_text}",
-                    response_code=400
-                )
-            else:
-                error_text = response.text
-                raise ServerErrors(
-                    message=f"Failed to send Slack message: {error_text}",
-                    response_code=response.status_code
-                )
+        # pooled client: no TCP+TLS handshake per notification; orjson
+        # encodes the blocks instead of httpx's stdlib json path
+        response = await _get_client().post(
+            webhook_url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"}
+        )
+
+        status_code = response.status_code
+        if status_code == 200:
+            _circuit_record_success(webhook_url)
+            # lazy %-formatting: the string only renders if INFO is enabled
+            Logger.info("Slack message sent successfully to %s", webhook_url)
+            return True
+
+        if status_code == 429 or status_code >= 500:
+            _circuit_record_failure(webhook_url, response.headers.get("Retry-After"))
+
+        # body decode only happens on failure paths
+        if status_code == 404:
+            raise ClientErrors(
+                message="Slack webhook URL not found. Please verify the webhook URL is correct.",
+                response_code=404
+            )
+        if status_code == 400:
+            raise ClientErrors(
+                message=f"Invalid Slack webhook request: {response.text}",
+                response_code=400
+            )
+        raise ServerErrors(
+            message=f"Failed to send Slack message: {response.text}",
+            response_code=status_code
+        )
 
     @staticmethod
     async def test_webhook(webhook_url: str) -> bool:
@@ -96,19 +195,9 @@ class SlackService:
         Returns:
             bool: True if test message sent successfully
         """
-        test_blocks = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "✅ *Test Message from Zyro*\n\nThis is a test notification to verify your Slack integration is working correctly."
-                }
-            }
-        ]
-
         return await SlackService.send_message(
             webhook_url=webhook_url,
-            blocks=test_blocks,
+            blocks=_TEST_BLOCKS,
             username="Zyro Bot",
             icon_emoji=":robot_face:"
         )
@@ -0,0 +1,102 @@
+import asyncio
+
+import orjson
+
+from app.core.celery_app import celery_app
+from app.core.redis_config import redis_client
+from app.common.logging.logging_config import Logger
+
+# Raw webhook bodies wait here between the HTTP handler and the worker;
+# the TTL bounds memory if a worker is down
+GITHUB_EVENT_KEY = "github:webhook:event:{delivery_id}"
+GITHUB_EVENT_TTL_SECONDS = 3600
+
+# Edit bursts (title then description saved within a second) are
+# coalesced: each delivery claims the key, waits out the window, and
+# only the last claimant still holding it runs the upsert
+COALESCE_KEY = "github:webhook:coalesce:{repo}:{number}:{is_pr}"
+COALESCE_WINDOW_SECONDS = 2
+
+
+def _coalesce_key(event_type: str, payload: dict):
+    """Debounce key for burst-prone edit events, else None"""
+    if payload.get('action') != 'edited':
+        return None
+    if event_type == 'pull_request':
+        number = payload.get('pull_request', {}).get('number')
+        is_pr = 1
+    elif event_type == 'issues':
+        number = payload.get('issue', {}).get('number')
+        is_pr = 0
+    else:
+        return None
+    repo = payload.get('repository', {}).get('full_name')
+    if not repo or number is None:
+        return None
+    return COALESCE_KEY.format(repo=repo, number=number, is_pr=is_pr)
+
+
+async def _process_event(event_type: str, payload: dict) -> dict:
+    """Run the async webhook service on a worker-local session"""
+    from app.db.connection import AsyncSessionLocal, engine
+    from app.services.github_webhook_service import GitHubWebhookService
+
+    try:
+        async with AsyncSessionLocal() as session:
+            return await GitHubWebhookService.process_webhook_event(
+                session=session,
+                event_type=event_type,
+                payload=payload
+            )
+    finally:
+        # each task runs on a fresh event loop; returning connections
+        # bound to a dead loop to the pool would poison later checkouts
+        await engine.dispose()
+
+
+@celery_app.task(
+    name="process_github_event_task",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    max_retries=5
+)
+def process_github_event_task(delivery_id: str, event_type: str, coalesced: bool = False):
+    """
+    Process a GitHub webhook event enqueued by the webhook endpoint.
+
+    The endpoint stores the raw body in Redis keyed by delivery ID and
+    returns 202 immediately; this task picks it up off the HTTP path.
+    Edit events defer themselves by the coalescing window first, and a
+    deferred run whose claim was overwritten by a newer delivery skips
+    its now-redundant upsert.
+    """
+    body = redis_client.get(GITHUB_EVENT_KEY.format(delivery_id=delivery_id))
+    if body is None:
+        Logger.warning(f"GitHub event payload missing for delivery {delivery_id}, skipping")
+        return {"status": "skipped", "reason": "payload expired or missing"}
+
+    # GitHub PR payloads run to hundreds of KB; orjson parses in C
+    payload = orjson.loads(body)
+
+    coalesce_key = _coalesce_key(event_type, payload)
+    if coalesce_key is not None:
+        if not coalesced:
+            redis_client.set(coalesce_key, delivery_id, ex=COALESCE_WINDOW_SECONDS + 3)
+            process_github_event_task.apply_async(
+                args=[delivery_id, event_type, True],
+                countdown=COALESCE_WINDOW_SECONDS
+            )
+            return {"status": "deferred", "window_seconds": COALESCE_WINDOW_SECONDS}
+
+        latest = redis_client.get(coalesce_key)
+        if latest is not None and latest != delivery_id:
+            redis_client.delete(GITHUB_EVENT_KEY.format(delivery_id=delivery_id))
+            Logger.info(f"GitHub delivery {delivery_id} superseded by {latest}, skipping")
+            return {"status": "skipped", "reason": "superseded by newer delivery"}
+
+    result = asyncio.run(_process_event(event_type, payload))
+
+    redis_client.delete(GITHUB_EVENT_KEY.format(delivery_id=delivery_id))
+    Logger.info(f"Processed GitHub event {event_type} delivery {delivery_id}: {result}")
+    return result
@@ -0,0 +1,36 @@
+import asyncio
+from typing import Optional
+
+from app.core.celery_app import celery_app
+from app.common.logging.logging_config import Logger
+
+
+@celery_app.task(
+    name="deliver_slack_notification_task",
+    autoretry_for=(Exception,),
+    retry_backoff=2,
+    retry_jitter=True,
+    max_retries=8
+)
+def deliver_slack_notification_task(
+    webhook_url: str,
+    notification_type: str,
+    data: dict,
+    channel: Optional[str] = None
+):
+    """
+    Deliver one formatted Slack notification off the request path.
+
+    Retries with exponential backoff absorb Slack 429s and transient
+    network failures without ever blocking an API request or a GitHub
+    webhook worker.
+    """
+    from app.services.slack_notification_service import SlackNotificationService
+
+    asyncio.run(SlackNotificationService.send_notification(
+        webhook_url=webhook_url,
+        notification_type=notification_type,
+        data=data,
+        channel=channel
+    ))
+    Logger.info(f"Delivered Slack notification {notification_type}")
@@ -2,14 +2,24 @@
 File validation utilities
 """
 import re
+from functools import lru_cache
 from typing import Tuple, Optional
 from fastapi import UploadFile, HTTPException, status
 
+# python-magic is optional; without it content sniffing is skipped and
+# validation falls back to the header/extension checks alone. The Magic
+# handle is a module singleton because construction loads the database.
+try:
+    import magic
+    _MIME_SNIFFER = magic.Magic(mime=True)
+except ImportError:
+    _MIME_SNIFFER = None
+
 # Maximum file size: 10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
 
 # Allowed file types
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS = frozenset({
     # Images
     'image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp',
     # Documents
@@ -24,14 +34,32 @@ ALLOWED_EXTENSIONS = {
     'application/zip', 'application/x-rar-compressed',
     # Code
     'text/javascript', 'application/json', 'text/x-python',
-}
+})
 
-ALLOWED_EXTENSIONS_BY_EXT = {
+ALLOWED_EXTENSIONS_BY_EXT = frozenset({
     '.jpg', '.jpeg', '.png', '.gif', '.webp',
     '.pdf', '.doc', '.docx', '.xls', '.xlsx',
     '.txt', '.csv', '.zip', '.rar',
     '.js', '.json', '.py', '.ts', '.tsx', '.jsx',
-}
+})
+
+# Built once; the old code sorted and joined the whole set for every
+# rejected upload
+_ALLOWED_EXT_MSG = "File type not allowed. Allowed types: " + ", ".join(sorted(ALLOWED_EXTENSIONS_BY_EXT))
+
+# Control characters forbidden in filenames (C0 range minus tab/LF/CR).
+# Deleting them via str.translate and comparing keeps the scan in C
+# instead of a per-character Python loop.
+_CTRL_CHAR_TABLE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(32) if c not in (9, 10, 13))
+)
+
+# Compiled once; re.sub with a string pattern re-hashes the pattern on
+# every call to hit re's internal cache
+_SANITIZE_RE = re.compile(r'[^\w\s.\-()\[\]]+')
+
+# Path separators map to underscores in one translate pass
+_PATH_SEP_TABLE = str.maketrans({'/': '_', '\\': '_'})
 
 
 def validate_file(
@@ -52,21 +80,16 @@ def validate_file(
     if hasattr(file, 'size') and file.size and file.size > max_size:
         return False, f"File size exceeds maximum allowed size of {max_size / (1024 * 1024):.1f}MB"
     
-    # Check content type
-    if file.content_type and file.content_type not in allowed_types:
-        # Fallback: check file extension
-        if file.filename:
-            ext = '.' + file.filename.rsplit('.', 1)[-1].lower()
-            if ext not in ALLOWED_EXTENSIONS_BY_EXT:
-                return False, f"File type not allowed. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS_BY_EXT))}"
-    elif not file.content_type:
-        # If no content type, check extension
-        if file.filename:
-            ext = '.' + file.filename.rsplit('.', 1)[-1].lower()
-            if ext not in ALLOWED_EXTENSIONS_BY_EXT:
-                return False, f"File type not allowed. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS_BY_EXT))}"
-        else:
+    # Check content type; when the MIME type is missing or not in the
+    # allow-set, fall back to a single extension check. Unlike the old
+    # two-branch version, an unknown content type with no filename is
+    # now rejected instead of slipping through.
+    if not (file.content_type and file.content_type in allowed_types):
+        if not file.filename:
             return False, "File type could not be determined"
+        ext = '.' + file.filename.rsplit('.', 1)[-1].lower() if '.' in file.filename else ''
+        if ext not in ALLOWED_EXTENSIONS_BY_EXT:
+            return False, _ALLOWED_EXT_MSG
     
     # Filename validation - allow most characters, we'll sanitize it when storing
     # Only reject truly dangerous characters that could cause security issues
@@ -76,12 +99,41 @@ def validate_file(
             return False, "Filename contains invalid characters (path separators not allowed)"
         
         # Check for null bytes or control characters
-        if '\x00' in file.filename or any(ord(c) < 32 and c not in '\t\n\r' for c in file.filename):
+        if file.filename.translate(_CTRL_CHAR_TABLE) != file.filename:
             return False, "Filename contains invalid control characters"
     
     return True, None
 
 
+async def sniff_file_content(
+    file: UploadFile,
+    allowed_types: Optional[frozenset] = None
+) -> Tuple[bool, Optional[str]]:
+    """
+    Content-based MIME check on the first 512 bytes only.
+
+    Reads a fixed-size prefix and seeks back, so validation cost is
+    constant regardless of upload size. No-op when python-magic is
+    not installed.
+
+    Returns:
+        (is_valid, error_message)
+    """
+    if _MIME_SNIFFER is None:
+        return True, None
+
+    if allowed_types is None:
+        allowed_types = ALLOWED_EXTENSIONS
+
+    head = await file.read(512)
+    await file.seek(0)
+
+    detected = _MIME_SNIFFER.from_buffer(head)
+    if detected not in allowed_types:
+        return False, f"File content does not match an allowed type (detected {detected})"
+    return True, None
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe storage
@@ -91,11 +143,11 @@ def sanitize_filename(filename: str) -> str:
         return "unnamed_file"
     
     # Remove path components
-    filename = filename.replace('..', '').replace('/', '_').replace('\\', '_')
-    
+    filename = filename.replace('..', '').translate(_PATH_SEP_TABLE)
+
     # Replace problematic characters with underscores
     # Keep: letters, numbers, dots, dashes, underscores, spaces, parentheses, brackets
-    sanitized = re.sub(r'[^\w\s.\-()\[\]]+', '_', filename)
+    sanitized = _SANITIZE_RE.sub('_', filename)
     
     # Remove leading/trailing dots and spaces (Windows doesn't like these)
     sanitized = sanitized.strip('. ')
@@ -112,15 +164,19 @@ def sanitize_filename(filename: str) -> str:
     return sanitized
 
 
+@lru_cache(maxsize=4096)
 def get_file_extension(filename: str) -> str:
     """Get file extension from filename"""
     return '.' + filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes <= 0:
+        return "0.0 B"
+    # bit_length picks the 1024-power directly; no divide loop
+    idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
@@ -65,6 +65,8 @@ def format_paginated_response(
             "page": page,
             "page_size": page_size,
             "total": total,
-            "total_pages": (total + page_size - 1) // page_size if total > 0 else 0
+            # ceiling division without the add/subtract dance; the
+            # page_size guard keeps a zero from dividing
+            "total_pages": -(-total // page_size) if total and page_size else 0
         }
     }
@@ -2,13 +2,142 @@
 Slack Notifier Utility
 Helper functions to send Slack notifications for various events
 """
+import asyncio
 from typing import Dict, Optional, Any
+
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.services.slack_notification_service import SlackNotificationService
 from app.models.model import Project
+from app.tasks.slack_task import deliver_slack_notification_task
 from app.common.logging.logging_config import Logger
 
+# Slack config per project, cached in-process so issue churn doesn't
+# re-query the project row for every event. Misses (no project / no
+# slack block) are cached too, via the sentinel.
+_slack_config_cache = TTLCache(maxsize=1024, ttl=60)
+_NO_CONFIG = object()
+
+# Event name -> config toggle key, shared by every call
+_NOTIFICATION_KEY_MAP = {
+    "issue_created": "issueCreated",
+    "issue_updated": "issueUpdated",
+    "issue_assigned": "issueAssigned",
+    "status_changed": "issueStatusChanged",
+}
+
+
+def invalidate_slack_config(project_id: int) -> None:
+    """Drop the cached Slack config after a project update"""
+    _slack_config_cache.pop(project_id, None)
+
+
+# Strong refs to in-flight enqueue tasks; create_task results are
+# weakly held by the loop and would otherwise be GC-able mid-flight
+_bg_tasks: set = set()
+
+
+def _enqueue_in_background(webhook_url, notification_type, data, channel, log_label: str) -> None:
+    """Publish the delivery task off the request path (fire and forget)"""
+    async def _publish():
+        try:
+            await asyncio.to_thread(
+                deliver_slack_notification_task.delay,
+                webhook_url,
+                notification_type,
+                data,
+                channel
+            )
+            Logger.info("Slack notification queued for %s", log_label)
+        except Exception as e:
+            Logger.error("Failed to queue Slack notification for %s: %s", notification_type, e)
+
+    task = asyncio.create_task(_publish())
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+
+
+# Issue events landing within the window are coalesced into a single
+# delivery (one webhook POST carrying a batch message) per project.
+# Bursts — bulk status moves, sprint board sweeps — otherwise serialize
+# through Slack's per-webhook rate limit one POST per event.
+_BATCH_WINDOW_SECONDS = 0.5
+_BATCH_MAX_EVENTS = 10
+_issue_batches: Dict[int, Dict[str, Any]] = {}
+
+
+def _dispatch_batch(project_id: int, batch: Dict[str, Any]) -> None:
+    events = batch["events"]
+    if len(events) == 1:
+        notification_type, data = events[0]
+        _enqueue_in_background(
+            batch["webhook_url"],
+            notification_type,
+            data,
+            batch["channel"],
+            f"{notification_type} in project {project_id}"
+        )
+        return
+    _enqueue_in_background(
+        batch["webhook_url"],
+        "issue_batch",
+        {"events": [{"notification_type": t, "data": d} for t, d in events]},
+        batch["channel"],
+        f"batch of {len(events)} events in project {project_id}"
+    )
+
+
+def _buffer_issue_event(
+    project_id: int,
+    webhook_url: str,
+    channel: Optional[str],
+    notification_type: str,
+    data: Dict[str, Any]
+) -> None:
+    batch = _issue_batches.get(project_id)
+    if batch is not None:
+        batch["events"].append((notification_type, data))
+        if len(batch["events"]) >= _BATCH_MAX_EVENTS:
+            _issue_batches.pop(project_id, None)
+            _dispatch_batch(project_id, batch)
+        return
+
+    _issue_batches[project_id] = {
+        "webhook_url": webhook_url,
+        "channel": channel,
+        "events": [(notification_type, data)],
+    }
+
+    async def _flush_after_window():
+        await asyncio.sleep(_BATCH_WINDOW_SECONDS)
+        pending = _issue_batches.pop(project_id, None)
+        if pending:
+            _dispatch_batch(project_id, pending)
+
+    task = asyncio.create_task(_flush_after_window())
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+
+
+async def _get_slack_config(session: AsyncSession, project_id: int) -> Optional[Dict[str, Any]]:
+    """Return the project's slack config dict, or None if unconfigured"""
+    cached = _slack_config_cache.get(project_id)
+    if cached is not None:
+        return None if cached is _NO_CONFIG else cached
+
+    # Only the JSON column comes over the wire; no ORM entity to hydrate
+    stmt = select(Project.data).where(Project.id == project_id)
+    row = (await session.execute(stmt)).first()
+
+    if row is None:
+        Logger.warning("Project %s not found for Slack notification", project_id)
+        slack_config = None
+    else:
+        slack_config = row[0].get("slack") if row[0] else None
+
+    _slack_config_cache[project_id] = slack_config if slack_config else _NO_CONFIG
+    return slack_config
+
 
 async def send_slack_notification_for_issue(
     session: AsyncSession,
@@ -30,38 +159,21 @@ async def send_slack_notification_for_issue(
     Returns:
         bool: True if notification sent successfully, False otherwise
     """
-    # Get project to check Slack configuration (direct query, no user validation needed)
-    stmt = select(Project).where(Project.id == project_id)
-    result = await session.execute(stmt)
-    project = result.scalar_one_or_none()
-
-    if not project:
-        Logger.warning(f"Project {project_id} not found for Slack notification")
+    # Cached read of the project's Slack config (direct lookup, no user
+    # validation needed)
+    slack_config = await _get_slack_config(session, project_id)
+    if not slack_config:
         return False
 
-    slack_config = project.data.get("slack") if project.data else None
-
-    if not slack_config:
+    # Disabled types bail before any payload or queue work
+    notification_key = _NOTIFICATION_KEY_MAP.get(notification_type)
+    if notification_key and not slack_config.get("notifications", {}).get(notification_key, True):
         return False
 
     webhook_url = slack_config.get("webhook_url")
     if not webhook_url:
         return False
 
-    # Check if this notification type is enabled
-    notifications = slack_config.get("notifications", {})
-    notification_key_map = {
-        "issue_created": "issueCreated",
-        "issue_updated": "issueUpdated",
-        "issue_assigned": "issueAssigned",
-        "status_changed": "issueStatusChanged",
-    }
-
-    notification_key = notification_key_map.get(notification_type)
-    if notification_key and not notifications.get(notification_key, True):
-        # Notification is disabled
-        return False
-
     # Prepare notification data
     notification_data = {
         "issue": issue_data,
@@ -70,19 +182,10 @@ async def send_slack_notification_for_issue(
 
     channel = slack_config.get("channel")
 
-    # Send notification (don't raise errors, just log them)
-    try:
-        await SlackNotificationService.send_notification(
-            webhook_url=webhook_url,
-            notification_type=notification_type,
-            data=notification_data,
-            channel=channel
-        )
-        Logger.info(f"Slack notification sent for {notification_type} in project {project_id}")
-        return True
-    except Exception as e:
-        Logger.error(f"Failed to send Slack notification for {notification_type}: {e}")
-        return False
+    # Buffer briefly so bursts collapse into one delivery; the flush
+    # hands off to the slack_notifications queue off the request path
+    _buffer_issue_event(project_id, webhook_url, channel, notification_type, notification_data)
+    return True
 
 
 async def send_slack_notification_for_sprint(
@@ -103,39 +206,27 @@ async def send_slack_notification_for_sprint(
     Returns:
         bool: True if notification sent successfully, False otherwise
     """
-    # Get project to check Slack configuration (direct query, no user validation needed)
-    stmt = select(Project).where(Project.id == project_id)
-    result = await session.execute(stmt)
-    project = result.scalar_one_or_none()
-
-    if not project:
+    # Cached read of the project's Slack config (direct lookup, no user
+    # validation needed)
+    slack_config = await _get_slack_config(session, project_id)
+    if not slack_config:
         return False
 
-    slack_config = project.data.get("slack") if project.data else None
-    if not slack_config:
+    notification_key = "sprintStarted" if event_type == "sprint_started" else "sprintEnded"
+    if not slack_config.get("notifications", {}).get(notification_key, False):
         return False
 
     webhook_url = slack_config.get("webhook_url")
     if not webhook_url:
         return False
 
-    notifications = slack_config.get("notifications", {})
-    notification_key = "sprintStarted" if event_type == "sprint_started" else "sprintEnded"
-    
-    if not notifications.get(notification_key, False):
-        return False
-
     channel = slack_config.get("channel")
 
-    try:
-        await SlackNotificationService.send_notification(
-            webhook_url=webhook_url,
-            notification_type=event_type,
-            data=sprint_data,
-            channel=channel
-        )
-        Logger.info(f"Slack notification sent for {event_type} in project {project_id}")
-        return True
-    except Exception as e:
-        Logger.error(f"Failed to send Slack notification for {event_type}: {e}")
-        return False
+    _enqueue_in_background(
+        webhook_url,
+        event_type,
+        sprint_data,
+        channel,
+        f"{event_type} in project {project_id}"
+    )
+    return True
@@ -1,6 +1,7 @@
 import sqlalchemy.exc
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.conf import APP_NAME, APP_VERSION, DEBUG, API_V1_PREFIX
@@ -12,6 +13,7 @@ from app.common.exception_handler import (
 )
 from app.common.errors import UserErrors, ClientErrors, DatabaseErrors
 from app.db.connection import engine
+from app.services.slack_service import close_slack_client
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -21,14 +23,16 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     yield
-    # Shutdown - properly dispose of database engine connections
+    # Shutdown - properly dispose of pooled HTTP and database connections
+    await close_slack_client()
     await engine.dispose()
 
 app = FastAPI(
     title=APP_NAME,
     version=APP_VERSION,
     debug=DEBUG,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # C-level JSON serialization for every response
 )
 
 # Configure CORS